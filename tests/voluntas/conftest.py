@@ -9,7 +9,9 @@ from voluntas.schemas import BeliefSet, Desire, DesireStatus, Intention, Plan, P
 class StubBDIAgent:
     def __init__(self):
         self.beliefs = BeliefSet()
+        self._beliefs_logged_at = None
         self.desires = []
+        self._desires_by_id = {}
         self.active_intention = None
         self.initial_intention_guidance = []
         self.enable_human_in_the_loop = False
@@ -64,6 +66,7 @@ class StubBDIAgent:
             {
                 "prompt": prompt,
                 "output_type": _kwargs.get("output_type"),
+                "instructions": _kwargs.get("instructions"),
             }
         )
         if not self._queued_run_outputs:
@@ -0,0 +1,288 @@
+import asyncio
+from types import SimpleNamespace
+
+from pydantic_ai import Agent
+from pydantic_ai.exceptions import UserError
+from pydantic_ai.messages import ModelResponse, TextPart, ToolCallPart, ToolReturnPart
+from pydantic_ai.models.function import FunctionModel
+from pydantic_ai.models.test import TestModel
+import pytest
+
+from voluntas import BDI
+from voluntas.prompts import INITIAL_BELIEF_EXTRACTION_INSTRUCTIONS
+from voluntas.schemas import BeliefExtractionResult, ExtractedBelief
+
+
+class _ExtractionProbe:
+    active = 0
+    peak = 0
+
+    def __init__(self) -> None:
+        self.extracted = False
+
+    async def extract_beliefs_from_desires(self) -> None:
+        type(self).active += 1
+        type(self).peak = max(type(self).peak, type(self).active)
+        await asyncio.sleep(0)
+        type(self).active -= 1
+        self.extracted = True
+
+
+@pytest.mark.asyncio
+async def test_batch_extract_beliefs_bounds_concurrency() -> None:
+    agents = [_ExtractionProbe() for _ in range(5)]
+
+    await BDI.batch_extract_beliefs_from_desires(agents, max_concurrency=2)
+
+    assert all(agent.extracted for agent in agents)
+    assert _ExtractionProbe.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_extract_beliefs_rejects_non_positive_concurrency() -> None:
+    with pytest.raises(ValueError):
+        await BDI.batch_extract_beliefs_from_desires([], max_concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_initial_belief_extraction_is_reused_for_same_desires() -> None:
+    desires = ["Summarize the repo at /tmp/cached-extraction-repo"]
+    extraction = BeliefExtractionResult(
+        beliefs=[
+            ExtractedBelief(name="repo_path", value="/tmp/cached-extraction-repo")
+        ],
+        explanation="Repository path from the desire.",
+    )
+    run_calls = []
+
+    async def fake_run(*_args, **kwargs):
+        run_calls.append(kwargs)
+        return SimpleNamespace(output=extraction)
+
+    first = BDI(model=TestModel(), desires=desires)
+    second = BDI(model=TestModel(), desires=desires)
+    first.run = fake_run
+    second.run = fake_run
+
+    await first.extract_beliefs_from_desires(cache=True)
+    await second.extract_beliefs_from_desires(cache=True)
+
+    assert len(run_calls) == 1
+    assert run_calls[0]["instructions"] == INITIAL_BELIEF_EXTRACTION_INSTRUCTIONS
+    assert second.beliefs.get("repo_path").value == "/tmp/cached-extraction-repo"
+
+
+@pytest.mark.asyncio
+async def test_initial_belief_extraction_cache_is_opt_in_and_keyed_by_prompts() -> None:
+    desires = ["Summarize the repo at /tmp/prompt-keyed-extraction-repo"]
+    run_calls = []
+
+    async def fake_run(*_args, **kwargs):
+        run_calls.append(kwargs)
+        return SimpleNamespace(
+            output=BeliefExtractionResult(
+                beliefs=[
+                    ExtractedBelief(
+                        name="repo_path", value="/tmp/prompt-keyed-extraction-repo"
+                    )
+                ],
+                explanation="Repository path from the desire.",
+            )
+        )
+
+    plain = BDI(model=TestModel(), desires=desires)
+    prompted = BDI(
+        model=TestModel(), desires=desires, system_prompt="Answer in French."
+    )
+    plain.run = fake_run
+    prompted.run = fake_run
+
+    await plain.extract_beliefs_from_desires()
+    await plain.extract_beliefs_from_desires()
+    assert len(run_calls) == 2
+
+    await plain.extract_beliefs_from_desires(cache=True)
+    await prompted.extract_beliefs_from_desires(cache=True)
+    assert len(run_calls) == 4
+
+
+def test_repeated_desire_strings_create_one_desire() -> None:
+    agent = BDI(
+        model=TestModel(),
+        desires=["Write the report", "Review the code", "Write the report"],
+    )
+
+    assert [desire.description for desire in agent.desires] == [
+        "Write the report",
+        "Review the code",
+    ]
+
+
+def test_agent_without_desires_does_not_log_empty_desire_state(capsys) -> None:
+    BDI(model=TestModel())
+
+    assert "Desires:" not in capsys.readouterr().out
+
+
+@pytest.mark.asyncio
+async def test_initial_belief_extraction_skip_without_fact_hints_is_opt_in() -> None:
+    agent = BDI(model=TestModel(), desires=["Improve the user experience"])
+    run_calls = []
+
+    async def fake_run(*_args, **kwargs):
+        run_calls.append(kwargs)
+        return SimpleNamespace(
+            output=BeliefExtractionResult(beliefs=[], explanation="No facts.")
+        )
+
+    agent.run = fake_run
+
+    await agent.extract_beliefs_from_desires(skip_without_fact_hints=True)
+    assert run_calls == []
+
+    await agent.extract_beliefs_from_desires()
+    assert len(run_calls) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "desire",
+    ["The project is called Voluntas", "Email Maria about the Berlin launch"],
+)
+async def test_initial_belief_extraction_keeps_plain_name_facts(desire: str) -> None:
+    agent = BDI(model=TestModel(), desires=[desire])
+    run_calls = []
+
+    async def fake_run(*_args, **kwargs):
+        run_calls.append(kwargs)
+        return SimpleNamespace(
+            output=BeliefExtractionResult(beliefs=[], explanation="No facts.")
+        )
+
+    agent.run = fake_run
+
+    await agent.extract_beliefs_from_desires()
+    await agent.extract_beliefs_from_desires(skip_without_fact_hints=True)
+
+    assert len(run_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_structured_output_schema_is_built_once_per_output_type() -> None:
+    agent = BDI(model=TestModel())
+
+    first = await agent.run("Extract beliefs.", output_type=BeliefExtractionResult)
+    second = await agent.run("Extract beliefs.", output_type=BeliefExtractionResult)
+
+    assert isinstance(first.output, BeliefExtractionResult)
+    assert isinstance(second.output, BeliefExtractionResult)
+    assert list(agent._output_schema_cache) == [BeliefExtractionResult]
+
+
+@pytest.mark.asyncio
+async def test_cached_output_schema_still_rejects_output_validators() -> None:
+    agent = BDI(model=TestModel())
+    await agent.run("Extract beliefs.", output_type=BeliefExtractionResult)
+
+    @agent.output_validator
+    def _keep(output: str) -> str:
+        return output
+
+    with pytest.raises(UserError):
+        await agent.run("Extract beliefs.", output_type=BeliefExtractionResult)
+
+
+def test_output_schema_override_matches_pinned_base_behaviour() -> None:
+    # BDI._prepare_output_schema overrides a private pydantic-ai method; these
+    # checks fail loudly if a dependency bump changes the base contract.
+    agent = BDI(model=TestModel())
+
+    assert Agent._prepare_output_schema(agent, None) is agent._output_schema
+    assert agent._prepare_output_schema(None) is agent._output_schema
+    cached = agent._prepare_output_schema(BeliefExtractionResult)
+    assert type(cached) is type(
+        Agent._prepare_output_schema(agent, BeliefExtractionResult)
+    )
+    assert agent._prepare_output_schema(BeliefExtractionResult) is cached
+
+    @agent.output_validator
+    def _keep(output: str) -> str:
+        return output
+
+    assert agent._prepare_output_schema(None) is agent._output_schema
+    with pytest.raises(UserError):
+        Agent._prepare_output_schema(agent, BeliefExtractionResult)
+    with pytest.raises(UserError):
+        agent._prepare_output_schema(BeliefExtractionResult)
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_caps_runs_across_agents_sharing_a_model() -> None:
+    active = 0
+    peak = 0
+
+    async def respond(_messages, _info):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return ModelResponse(parts=[TextPart("done")])
+
+    model = FunctionModel(respond, model_name="shared-test-model")
+    agents = [BDI(model=model, max_concurrency=1) for _ in range(3)]
+
+    await asyncio.gather(*(agent.run("Go.") for agent in agents))
+
+    assert peak == 1
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_first_limit_wins_for_a_shared_model() -> None:
+    active = 0
+    peak = 0
+
+    async def respond(_messages, _info):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return ModelResponse(parts=[TextPart("done")])
+
+    model = FunctionModel(respond, model_name="mixed-limit-test-model")
+    strict = BDI(model=model, max_concurrency=1)
+    await strict.run("Go.")
+    relaxed = [BDI(model=model, max_concurrency=3) for _ in range(3)]
+
+    await asyncio.gather(strict.run("Go."), *(agent.run("Go.") for agent in relaxed))
+
+    assert peak == 1
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_allows_nested_runs_from_tools() -> None:
+    async def respond(messages, info):
+        last_parts = messages[-1].parts
+        if info.function_tools and not any(
+            isinstance(part, ToolReturnPart) for part in last_parts
+        ):
+            return ModelResponse(parts=[ToolCallPart("delegate", {})])
+        return ModelResponse(parts=[TextPart("done")])
+
+    model = FunctionModel(respond, model_name="nested-run-test-model")
+    helper = BDI(model=model, max_concurrency=1)
+    outer = BDI(model=model, max_concurrency=1)
+
+    @outer.tool_plain
+    async def delegate() -> str:
+        return (await helper.run("Help.")).output
+
+    result = await asyncio.wait_for(outer.run("Go."), timeout=5)
+
+    assert result.output == "done"
+
+
+def test_max_concurrency_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        BDI(model=TestModel(), max_concurrency=0)
@@ -1,4 +1,4 @@
-from voluntas.schemas import BeliefUpdateDecision
+from voluntas.schemas import BeliefSet, BeliefUpdateDecision
 
 
 def test_belief_update_decision_schema_has_typed_normalized_value() -> None:
@@ -6,3 +6,56 @@ def test_belief_update_decision_schema_has_typed_normalized_value() -> None:
     normalized_value = schema["properties"]["normalized_value"]
 
     assert normalized_value.get("type") == "string"
+
+
+def test_belief_set_json_round_trip_preserves_beliefs() -> None:
+    beliefs = BeliefSet()
+    beliefs.upsert("repo_path", "/tmp/repo", "test", certainty=0.9)
+    beliefs.upsert("attempts", 3, "test")
+
+    restored = BeliefSet.load_json(beliefs.dump_json())
+
+    assert restored.beliefs == beliefs.beliefs
+    assert restored.beliefs is not beliefs.beliefs
+
+
+def test_belief_set_render_is_reused_until_mutation() -> None:
+    beliefs = BeliefSet()
+    line_format = "- {name}: {value} (Certainty: {certainty:.2f})"
+    assert beliefs.render(line_format, "empty") == "empty"
+
+    beliefs.upsert("repo_path", "/tmp/repo", "test", certainty=0.9)
+    version = beliefs.version
+    first = beliefs.render(line_format, "empty")
+    assert first == "- repo_path: /tmp/repo (Certainty: 0.90)"
+
+    assert beliefs.upsert("repo_path", "/tmp/repo", "test", certainty=0.5) == (
+        "unchanged"
+    )
+    assert beliefs.version == version
+    assert beliefs.render(line_format, "empty") is first
+
+    beliefs.upsert("repo_path", "/tmp/other", "test", certainty=0.9)
+    assert beliefs.version == version + 1
+    assert beliefs.render(line_format, "empty") == (
+        "- repo_path: /tmp/other (Certainty: 0.90)"
+    )
+
+    beliefs.remove("repo_path")
+    assert beliefs.render(line_format, "empty") == "empty"
+
+
+def test_belief_set_changed_since_returns_only_newer_mutations() -> None:
+    beliefs = BeliefSet()
+    beliefs.upsert("repo_path", "/tmp/repo", "test")
+    beliefs.upsert("branch", "main", "test")
+    checkpoint = beliefs.version
+
+    assert beliefs.changed_since(checkpoint) == {}
+
+    beliefs.upsert("branch", "dev", "test")
+    beliefs.upsert("attempts", 1, "test")
+    beliefs.remove("repo_path")
+
+    assert set(beliefs.changed_since(checkpoint)) == {"branch", "attempts"}
+    assert set(beliefs.changed_since(0)) == {"branch", "attempts"}
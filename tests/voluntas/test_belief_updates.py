@@ -267,3 +267,19 @@ async def test_step_beliefs_resolve_conflicting_values_in_one_batch(
     assert stub_agent.beliefs.get("api_status").value == "down"
     assert len(stub_agent.run_calls) == 1
     assert stub_agent.run_calls[0]["output_type"] is BatchBeliefResolutionResult
+
+
+@pytest.mark.asyncio
+async def test_batch_stamps_directly_applied_beliefs_once(stub_agent) -> None:
+    await update_beliefs_from_step_extraction(
+        stub_agent,
+        [
+            {"name": "repo_path", "value": "/tmp/repo"},
+            {"name": "service_status", "value": "online"},
+        ],
+        source="step_1",
+    )
+
+    repo_path = stub_agent.beliefs.get("repo_path")
+    service_status = stub_agent.beliefs.get("service_status")
+    assert repo_path.timestamp == service_status.timestamp
@@ -1,8 +1,11 @@
+import asyncio
+
 import pytest
 
 import voluntas.cycle as cycle
 import voluntas.monitoring as monitoring
 from voluntas.execution import ExecutionOutcome, ExecutionOutcomeKind
+from voluntas.prompts import RECONSIDERATION_INSTRUCTIONS
 from voluntas.schemas import DesireStatus, PlanStatus, PlanStep, ReconsiderResult
 
 
@@ -37,14 +40,110 @@ async def test_cycle_stops_when_idle_and_hitl_disabled(stub_agent) -> None:
 
 
 @pytest.mark.asyncio
+async def test_run_cycles_parallel_stops_each_agent_on_final_status(
+    stub_agent,
+) -> None:
+    idle_agent = stub_agent
+    done_agent = type(stub_agent)()
+    done_agent.add_desire(
+        desire_id="desire_done",
+        description="Done work",
+        status=DesireStatus.ACHIEVED,
+    )
+
+    statuses = await cycle.run_cycles_parallel(
+        [idle_agent, done_agent], cycles=3, max_concurrency=1
+    )
+
+    assert statuses == [["stopped"], ["terminal"]]
+    assert idle_agent.cycle_count == 1
+    assert done_agent.cycle_count == 1
+
+
+@pytest.mark.asyncio
+async def test_run_cycles_parallel_overlaps_agent_cycles(
+    monkeypatch,
+    stub_agent,
+) -> None:
+    active = 0
+    peak = 0
+
+    async def slow_cycle(_agent):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return "stopped"
+
+    monkeypatch.setattr(cycle, "bdi_cycle", slow_cycle)
+    agents = [stub_agent, type(stub_agent)(), type(stub_agent)()]
+
+    statuses = await cycle.run_cycles_parallel(agents, cycles=2, max_concurrency=2)
+
+    assert statuses == [["stopped"]] * 3
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_run_cycles_parallel_cancels_siblings_when_an_agent_fails(
+    monkeypatch,
+    stub_agent,
+) -> None:
+    failing_agent = type(stub_agent)()
+    cancelled = []
+
+    async def cycle_or_fail(agent):
+        if agent is failing_agent:
+            raise RuntimeError("cycle failed")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(agent)
+            raise
+        return "stopped"
+
+    monkeypatch.setattr(cycle, "bdi_cycle", cycle_or_fail)
+
+    with pytest.raises(RuntimeError, match="cycle failed"):
+        await cycle.run_cycles_parallel([stub_agent, failing_agent])
+
+    assert cancelled == [stub_agent]
+
+
+@pytest.mark.asyncio
+async def test_run_cycles_parallel_rejects_duplicate_agents(stub_agent) -> None:
+    with pytest.raises(ValueError):
+        await cycle.run_cycles_parallel([stub_agent, stub_agent])
+
+
+@pytest.mark.asyncio
+async def test_run_cycles_parallel_rejects_human_in_the_loop_agents(
+    monkeypatch,
+    stub_agent,
+) -> None:
+    stub_agent.enable_human_in_the_loop = True
+
+    async def unexpected_cycle(_agent):
+        raise AssertionError("no cycle should start")
+
+    monkeypatch.setattr(cycle, "bdi_cycle", unexpected_cycle)
+
+    with pytest.raises(ValueError, match="human-in-the-loop"):
+        await cycle.run_cycles_parallel([type(stub_agent)(), stub_agent])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("interruption", [EOFError, KeyboardInterrupt])
 async def test_cycle_returns_interrupted_when_idle_prompt_has_no_input(
     monkeypatch,
     stub_agent,
+    interruption,
 ) -> None:
     stub_agent.enable_human_in_the_loop = True
     monkeypatch.setattr(
         "builtins.input",
-        lambda _prompt: (_ for _ in ()).throw(EOFError),
+        lambda _prompt: (_ for _ in ()).throw(interruption),
     )
 
     result = await cycle.bdi_cycle(stub_agent)
@@ -352,5 +451,7 @@ async def test_reconsideration_prompt_is_plan_aware_on_failure_path(stub_agent)
     assert "failed step" in prompt
     assert "remaining step" in prompt
     assert "known_fact: current" in prompt
+    assert "Evaluate the active Plan as a whole" not in prompt
+    assert stub_agent.run_calls[0]["instructions"] == RECONSIDERATION_INSTRUCTIONS
     assert desire.status is DesireStatus.ACTIVE
     assert stub_agent.active_intention is intention
@@ -1,8 +1,17 @@
 from types import SimpleNamespace
+import json
 
 import pytest
 
-from voluntas.hitl import apply_user_guided_action, build_failure_context
+from voluntas.hitl import (
+    apply_user_guided_action,
+    build_failure_context,
+    human_in_the_loop_intervention,
+    interpret_user_nl_guidance,
+    present_context_to_user,
+    summarize_directive_for_user,
+)
+from voluntas.prompts import build_hitl_interpretation_prompt
 from voluntas.schemas import (
     DesireSatisfactionResult,
     DesireStatus,
@@ -41,6 +50,12 @@ def test_failure_context_describes_active_plan_and_current_plan_step(stub_agent)
         intention.active_plan.steps[2].model_dump()
     ]
 
+    assert json.loads(context["serialized"]["remaining_plan_steps"]) == (
+        context["remaining_plan_steps"]
+    )
+    prompt = build_hitl_interpretation_prompt(context, "try again", "No tools.")
+    assert context["serialized"]["original_failed_step_object"] in prompt
+
 
 @pytest.mark.asyncio
 async def test_skip_current_step_completes_intention(stub_agent) -> None:
@@ -211,3 +226,135 @@ async def test_plan_step_list_manipulations_preserve_intention_commitment(
     assert intention.active_plan.status is PlanStatus.ACTIVE
     assert intention.active_plan.current_step_index == 1
     assert [step.description for step in intention.active_plan.steps] == expected_steps
+
+
+@pytest.mark.asyncio
+async def test_interpret_guidance_builds_tool_schema_once(stub_agent) -> None:
+    schema_calls = []
+
+    class ReadFileTool:
+        @classmethod
+        def model_json_schema(cls):
+            schema_calls.append(cls)
+            return {"properties": {"path": {"type": "string"}}}
+
+    stub_agent.tool_configs = {"read_file": ReadFileTool}
+    directive = PlanManipulationDirective(
+        manipulation_type="RETRY_CURRENT_AS_IS",
+        user_guidance_summary="Retry",
+    )
+    stub_agent.queue_run_output(directive)
+    stub_agent.queue_run_output(directive)
+    context = {
+        "desire_id": "desire_tools",
+        "failed_step_number": 1,
+        "total_steps_in_plan": 1,
+        "failed_step_description": "read file",
+        "original_failed_step_object": {},
+        "is_tool_call": False,
+        "tool_name": None,
+        "tool_params": None,
+        "step_result_output": "failed",
+        "current_beliefs": "No current beliefs.",
+        "remaining_plan_steps": [],
+    }
+
+    assert await interpret_user_nl_guidance(stub_agent, "retry", context) == directive
+    assert await interpret_user_nl_guidance(stub_agent, "retry", context) == directive
+
+    assert schema_calls == [ReadFileTool]
+    assert '"path"' in stub_agent.run_calls[1]["prompt"]
+
+
+@pytest.mark.asyncio
+async def test_hitl_intervention_asks_again_after_decline(
+    monkeypatch, stub_agent
+) -> None:
+    desire = stub_agent.add_desire(
+        desire_id="desire_decline", description="Decline test", status=DesireStatus.ACTIVE
+    )
+    intention = stub_agent.set_current_intention(
+        desire_id=desire.id, step_descriptions=["failing step"]
+    )
+    answers = iter(["first guidance", "n", "second guidance", "y"])
+    monkeypatch.setattr("builtins.input", lambda _prompt="": next(answers))
+    for summary in ("first", "second"):
+        stub_agent.queue_run_output(
+            PlanManipulationDirective(
+                manipulation_type="RETRY_CURRENT_AS_IS",
+                user_guidance_summary=summary,
+            )
+        )
+
+    result = await human_in_the_loop_intervention(
+        stub_agent,
+        intention,
+        intention.active_plan.current_step(),
+        SimpleNamespace(output="failed output"),
+    )
+
+    assert result == (True, False)
+    assert len(stub_agent.run_calls) == 2
+    assert "second guidance" in stub_agent.run_calls[1]["prompt"]
+
+
+@pytest.mark.asyncio
+async def test_hitl_intervention_applies_canonical_command_without_llm(
+    monkeypatch, stub_agent
+) -> None:
+    desire = stub_agent.add_desire(
+        desire_id="desire_skip", description="Skip test", status=DesireStatus.ACTIVE
+    )
+    intention = stub_agent.set_current_intention(
+        desire_id=desire.id, step_descriptions=["failing step", "next step"]
+    )
+    answers = iter([" Skip "])
+    monkeypatch.setattr("builtins.input", lambda _prompt="": next(answers))
+
+    result = await human_in_the_loop_intervention(
+        stub_agent,
+        intention,
+        intention.active_plan.current_step(),
+        SimpleNamespace(output="failed output"),
+    )
+
+    assert result == (True, False)
+    assert stub_agent.run_calls == []
+    assert intention.active_plan.current_step().description == "next step"
+
+
+def test_present_context_and_summary_use_real_line_breaks(capsys, stub_agent) -> None:
+    intention = stub_agent.set_current_intention(
+        desire_id="desire_display", step_descriptions=["failing step", "next step"]
+    )
+    stub_agent.beliefs.upsert("repo_path", "/tmp/repo", source="user", certainty=0.5)
+    context = build_failure_context(
+        stub_agent,
+        intention,
+        intention.active_plan.current_step(),
+        SimpleNamespace(output="failed output"),
+    )
+
+    present_context_to_user(context)
+    summary = summarize_directive_for_user(
+        PlanManipulationDirective(
+            manipulation_type="COMMENT_NO_ACTION",
+            user_guidance_summary="Just a note",
+        )
+    )
+
+    output = capsys.readouterr().out
+    assert "HUMAN INTERVENTION REQUIRED for Desire 'desire_display'" in output
+    assert "  1. next step" in output
+    assert "  - repo_path: /tmp/repo (Source: user, Certainty: 0.50" in output
+    assert json.loads(context["serialized"]["current_beliefs"])["repo_path"][
+        "value"
+    ] == "/tmp/repo"
+    assert context["current_beliefs"]["repo_path"]["value"] == "/tmp/repo"
+    assert json.loads(json.dumps(context["current_beliefs"]))["repo_path"][
+        "source"
+    ] == "user"
+    assert summary.splitlines() == [
+        "Action Type: Comment No Action",
+        "LLM's Understanding: Just a note",
+    ]
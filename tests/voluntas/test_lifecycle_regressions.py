@@ -4,11 +4,10 @@ import voluntas.cycle as cycle
 import voluntas.execution as execution
 from voluntas.logging import log_states
 from voluntas.schemas import (
-    BeliefExtractionResult,
     DesireSatisfactionResult,
     DesireStatus,
     PlanStatus,
-    StepAssessmentResult,
+    StepAnalysisResult,
 )
 from voluntas.schemas.belief_schemas import (
     BatchBeliefResolutionDecision,
@@ -54,10 +53,7 @@ async def test_cycle_preserves_one_active_intention_through_write_and_verificati
 
     stub_agent.queue_run_output("implementation written")
     stub_agent.queue_run_output(
-        StepAssessmentResult(success=True, reason="write phase completed")
-    )
-    stub_agent.queue_run_output(
-        BeliefExtractionResult(beliefs=[], explanation="no new beliefs")
+        StepAnalysisResult(success=True, reason="write phase completed")
     )
 
     first_result = await cycle.bdi_cycle(stub_agent)
@@ -76,10 +72,7 @@ async def test_cycle_preserves_one_active_intention_through_write_and_verificati
 
     stub_agent.queue_run_output("verification passed")
     stub_agent.queue_run_output(
-        StepAssessmentResult(success=True, reason="verification phase completed")
-    )
-    stub_agent.queue_run_output(
-        BeliefExtractionResult(beliefs=[], explanation="no new beliefs")
+        StepAnalysisResult(success=True, reason="verification phase completed")
     )
     stub_agent.queue_run_output(
         DesireSatisfactionResult(satisfied=True, reason="write and verification passed")
@@ -117,14 +110,14 @@ async def test_execute_intentions_batches_belief_resolution_from_step_extraction
     stub_agent.beliefs.upsert("repo_path", "/old/repo", "seed", certainty=0.8)
     stub_agent.beliefs.upsert("service_status", "offline", "seed", certainty=0.8)
     stub_agent.queue_run_output("result written in /tmp/repo and service is online")
-    stub_agent.queue_run_output(StepAssessmentResult(success=True, reason="progress"))
     stub_agent.queue_run_output(
-        BeliefExtractionResult(
+        StepAnalysisResult(
+            success=True,
+            reason="progress",
             beliefs=[
                 {"name": "repository_path", "value": "/tmp/repo", "certainty": 0.95},
                 {"name": "service_status", "value": "online", "certainty": 0.9},
             ],
-            explanation="extracted execution facts",
         )
     )
     stub_agent.queue_run_output(
@@ -161,8 +154,7 @@ async def test_execute_intentions_batches_belief_resolution_from_step_extraction
     assert stub_agent.beliefs.get("service_status").value == "online"
     assert [call["output_type"] for call in stub_agent.run_calls] == [
         None,
-        StepAssessmentResult,
-        BeliefExtractionResult,
+        StepAnalysisResult,
         BatchBeliefResolutionResult,
     ]
     assert (
@@ -210,3 +202,24 @@ def test_log_states_exposes_desire_intention_plan_and_plan_step(
     assert "Plan active" in output
     assert "Plan Step 2/3" in output
     assert "write lifecycle regression" in output
+
+
+def test_verbose_log_states_skips_unchanged_belief_listing(
+    capsys,
+    stub_agent,
+) -> None:
+    stub_agent.verbose = True
+    stub_agent.beliefs.upsert("repo_path", "/tmp/repo", "seed")
+
+    log_states(stub_agent, ["beliefs"])
+    first = capsys.readouterr().out
+    log_states(stub_agent, ["beliefs"])
+    repeated = capsys.readouterr().out
+    stub_agent.beliefs.upsert("repo_path", "/srv/repo", "seed")
+    log_states(stub_agent, ["beliefs"])
+    changed = capsys.readouterr().out
+
+    assert "repo_path: /tmp/repo" in first
+    assert "repo_path" not in repeated
+    assert "Beliefs: 1 items (unchanged since last listing)" in repeated
+    assert "repo_path: /srv/repo" in changed
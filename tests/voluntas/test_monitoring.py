@@ -214,3 +214,42 @@ async def test_reconsider_repairs_remaining_steps_and_preserves_history(
     assert plan.current_step_index == 1
     assert plan.status is PlanStatus.ACTIVE
     assert len(plan.step_history) == 1
+
+
+def test_history_prompts_clip_long_step_results(stub_agent) -> None:
+    intention = stub_agent.set_current_intention(
+        desire_id="desire_history_clip",
+        step_descriptions=["dump file"],
+    )
+    plan = intention.active_plan
+    long_result = "x" * (monitoring.MAX_HISTORY_RESULT_CHARS + 25)
+    plan.add_to_history(plan.steps[0], long_result, True, {})
+
+    history = monitoring.generate_history_context(intention, include_details=True)
+    completed_text, _ = monitoring._format_step_outcomes(intention)
+
+    for text in (history, completed_text):
+        assert long_result not in text
+        assert (
+            "x" * monitoring.MAX_HISTORY_RESULT_CHARS + "... [25 chars omitted]" in text
+        )
+
+
+def test_generate_history_context_reuses_text_until_history_changes(
+    stub_agent,
+) -> None:
+    intention = stub_agent.set_current_intention(
+        desire_id="desire_history_cache",
+        step_descriptions=["first step", "second step"],
+    )
+    plan = intention.active_plan
+    plan.add_to_history(plan.steps[0], "first result", True, {})
+
+    first = monitoring.generate_history_context(intention)
+    assert monitoring.generate_history_context(intention) is first
+
+    plan.current_step_index = 1
+    plan.add_to_history(plan.steps[1], "second result", False, {})
+
+    updated = monitoring.generate_history_context(intention)
+    assert "Plan Step 2: second step - Failed" in updated
@@ -3,7 +3,7 @@ from types import SimpleNamespace
 import pytest
 
 import voluntas.execution as execution
-from voluntas.schemas import DesireStatus, StepAssessmentResult
+from voluntas.schemas import DesireStatus, ExtractedBelief, StepAnalysisResult
 
 
 @pytest.mark.asyncio
@@ -17,23 +17,18 @@ async def test_failed_step_retry_reuses_analysis_extracted_beliefs(
         desire_id=desire.id, step_descriptions=["step one"]
     )
     extracted = [{"name": "failure_reason", "value": "missing file", "certainty": 0.9}]
-    extraction_calls = 0
 
     async def failed_step_attempt(*_args, **_kwargs):
         return SimpleNamespace(output="failed because file is missing")
 
-    async def extract_once_per_analysis(*_args, **_kwargs):
-        nonlocal extraction_calls
-        extraction_calls += 1
-        return list(extracted)
-
     monkeypatch.setattr(execution, "_run_step_attempt", failed_step_attempt)
-    monkeypatch.setattr(
-        execution, "extract_relevant_beliefs_from_result", extract_once_per_analysis
-    )
     for _ in range(execution.MAX_STEP_RETRIES + 1):
         stub_agent.queue_run_output(
-            StepAssessmentResult(success=False, reason="Still failed")
+            StepAnalysisResult(
+                success=False,
+                reason="Still failed",
+                beliefs=[ExtractedBelief(**extracted[0])],
+            )
         )
 
     step_result, step_succeeded, retry_ctx, early_return = (
@@ -45,6 +40,7 @@ async def test_failed_step_retry_reuses_analysis_extracted_beliefs(
     assert step_result is not None
     assert step_succeeded is False
     assert early_return is None
-    assert extraction_calls == len(retry_ctx.failure_history)
+    # One analysis call per attempt supplies both the verdict and the beliefs.
+    assert len(stub_agent.run_calls) == len(retry_ctx.failure_history)
     assert retry_ctx.failure_history
     assert all(failure["beliefs"] == extracted for failure in retry_ctx.failure_history)
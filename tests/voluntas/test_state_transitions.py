@@ -1,6 +1,8 @@
 import pytest
 
+from voluntas.prompts import DESIRE_SATISFACTION_INSTRUCTIONS
 from voluntas.schemas import (
+    Desire,
     DesireSatisfactionResult,
     DesireStatus,
     Intention,
@@ -13,8 +15,10 @@ from voluntas.state_transitions import (
     complete_intention_and_update_desire,
     fail_desire_for_intention,
     finalize_current_intention,
+    has_active_desires,
     remove_intention,
     replan_desire_for_intention,
+    update_desire_status,
 )
 
 
@@ -28,6 +32,8 @@ def test_remove_intention_only_removes_active_commitment(stub_agent) -> None:
 
     assert remove_intention(stub_agent, other) == "missing"
     assert stub_agent.active_intention is active
+    assert remove_intention(stub_agent, active.model_copy(deep=True)) == "missing"
+    assert stub_agent.active_intention is active
     assert remove_intention(stub_agent, active) == "current"
     assert stub_agent.active_intention is None
 
@@ -47,6 +53,8 @@ async def test_satisfied_desire_releases_active_intention(stub_agent) -> None:
     assert satisfied is True
     assert desire.status is DesireStatus.ACHIEVED
     assert stub_agent.active_intention is None
+    assert stub_agent.run_calls[0]["instructions"] == DESIRE_SATISFACTION_INSTRUCTIONS
+    assert "- Description: finish" in stub_agent.run_calls[0]["prompt"]
 
 
 @pytest.mark.asyncio
@@ -105,3 +113,50 @@ def test_fail_and_finalize_release_matching_active_intention(stub_agent) -> None
     assert done_desire.status is DesireStatus.ACHIEVED
     assert stub_agent.active_intention is None
     assert all_desires_terminal(stub_agent) is True
+
+
+def test_has_active_desires_ignores_terminal_desires(stub_agent) -> None:
+    assert has_active_desires(stub_agent) is False
+
+    stub_agent.add_desire(
+        desire_id="done", description="finished", status=DesireStatus.ACHIEVED
+    )
+    assert has_active_desires(stub_agent) is False
+
+    stub_agent.add_desire(desire_id="todo", description="queued")
+    assert has_active_desires(stub_agent) is True
+
+
+def test_update_desire_status_sees_desires_appended_after_lookup(stub_agent) -> None:
+    first = stub_agent.add_desire(desire_id="first", description="first")
+    assert update_desire_status(stub_agent, "first", DesireStatus.ACTIVE) is True
+    assert update_desire_status(stub_agent, "second", DesireStatus.ACTIVE) is False
+
+    second = stub_agent.add_desire(desire_id="second", description="second")
+
+    assert update_desire_status(stub_agent, "second", DesireStatus.ACTIVE) is True
+    assert first.status is DesireStatus.ACTIVE
+    assert second.status is DesireStatus.ACTIVE
+
+
+def test_update_desire_status_sees_replaced_and_reappended_desires(
+    stub_agent,
+) -> None:
+    stub_agent.add_desire(desire_id="first", description="first")
+    stub_agent.add_desire(desire_id="second", description="second")
+    assert update_desire_status(stub_agent, "first", DesireStatus.ACTIVE) is True
+
+    replacement = Desire(id="replacement", description="replacement")
+    stub_agent.desires[0] = replacement
+    assert update_desire_status(stub_agent, "first", DesireStatus.FAILED) is False
+    assert (
+        update_desire_status(stub_agent, "replacement", DesireStatus.ACTIVE) is True
+    )
+    assert replacement.status is DesireStatus.ACTIVE
+
+    second = stub_agent.desires.pop(1)
+    third = stub_agent.add_desire(desire_id="third", description="third")
+    assert update_desire_status(stub_agent, "second", DesireStatus.FAILED) is False
+    assert update_desire_status(stub_agent, "third", DesireStatus.ACTIVE) is True
+    assert second.status is DesireStatus.PENDING
+    assert third.status is DesireStatus.ACTIVE
@@ -1,4 +1,6 @@
 import json
+import sys
+import threading
 from types import SimpleNamespace
 
 import pytest
@@ -16,7 +18,11 @@ from pydantic_ai.messages import (
 import voluntas.agent as agent_module
 from voluntas import usage as usage_module
 from voluntas.agent import BDI
-from voluntas.logging import build_structured_run_log_entry
+from voluntas.logging import (
+    build_structured_run_log_entry,
+    configure_terminal_output_mirror,
+    disable_terminal_output_mirror,
+)
 
 
 def _build_result(
@@ -362,6 +368,36 @@ async def test_bdi_run_persists_structured_log_after_each_call(
     ]
 
 
+@pytest.mark.asyncio
+async def test_bdi_run_serializes_structured_log_off_the_event_loop(
+    tmp_path, monkeypatch
+) -> None:
+    structured_log_path = tmp_path / "agent-run.json"
+    dump_threads = []
+    real_dumps = json.dumps
+
+    def recording_dumps(*args, **kwargs):
+        dump_threads.append(threading.current_thread())
+        return real_dumps(*args, **kwargs)
+
+    async def fake_run(self, user_prompt=None, **_kwargs):
+        messages = [
+            ModelRequest(parts=[UserPromptPart(str(user_prompt))]),
+            ModelResponse(parts=[TextPart(content="done")]),
+        ]
+        return _build_result(messages=messages, output="done")
+
+    monkeypatch.setattr(Agent, "run", fake_run)
+    agent = BDI(structured_log_file_path=str(structured_log_path))
+    monkeypatch.setattr(agent_module.json, "dumps", recording_dumps)
+
+    await agent.run("first")
+
+    assert dump_threads
+    assert threading.main_thread() not in dump_threads
+    assert len(json.loads(structured_log_path.read_text())) == 1
+
+
 @pytest.mark.asyncio
 async def test_bdi_run_persists_structured_log_usage_metadata(
     tmp_path,
@@ -453,3 +489,43 @@ def test_bdi_initializes_text_and_structured_logs_independently(
     assert mirrored_paths == [str(text_log_path)]
     assert text_log_path.exists()
     assert json.loads(structured_log_path.read_text()) == []
+
+
+def test_terminal_mirror_writes_stripped_output_in_order(tmp_path) -> None:
+    log_path = tmp_path / "mirror.log"
+    configure_terminal_output_mirror(str(log_path))
+    try:
+        print("\x1b[91mfirst\x1b[0m")
+        sys.stderr.write("second\n")
+        sys.stdout.flush()
+        assert log_path.read_text() == "first\nsecond\n"
+        print("third")
+    finally:
+        disable_terminal_output_mirror()
+
+    assert log_path.read_text() == "first\nsecond\nthird\n"
+
+
+def test_stale_terminal_mirror_stream_writes_to_terminal_only(tmp_path) -> None:
+    first_log = tmp_path / "first.log"
+    second_log = tmp_path / "second.log"
+    configure_terminal_output_mirror(str(first_log))
+    stale_stream = sys.stdout
+    try:
+        # Replacing the mirror closes the first writer while a handle to its
+        # stream survives, as it would inside a logging.StreamHandler.
+        configure_terminal_output_mirror(str(second_log))
+
+        def write_through_stale_stream() -> None:
+            stale_stream.write("late\n")
+            stale_stream.flush()
+
+        worker = threading.Thread(target=write_through_stale_stream, daemon=True)
+        worker.start()
+        worker.join(timeout=5)
+        assert not worker.is_alive()
+    finally:
+        disable_terminal_output_mirror()
+
+    assert "late" not in first_log.read_text()
+    assert "late" not in second_log.read_text()
@@ -4,10 +4,16 @@ This module contains the main BDI agent class that orchestrates all BDI componen
 beliefs, desires, intentions, planning, execution, monitoring, and human-in-the-loop.
 """
 
+import asyncio
+from collections import OrderedDict
 from collections.abc import Sequence
+from contextlib import asynccontextmanager
+import hashlib
 import json
 from pathlib import Path
-from typing import Any, Generic, List, Optional, TypeVar, overload
+import re
+from typing import Any, AsyncIterator, Generic, List, Optional, TypeVar, overload
+import weakref
 
 from pydantic_ai import Agent, models, usage as _usage
 from pydantic_ai.agent import (
@@ -17,7 +23,8 @@ from pydantic_ai.agent import (
     RunOutputDataT,
 )
 from pydantic_ai.builtin_tools import AbstractBuiltinTool
-from pydantic_ai.messages import ModelMessage, UserContent
+from pydantic_ai.messages import ModelMessage, ModelResponse, UserContent
+from pydantic_ai.models.wrapper import WrapperModel
 from pydantic_ai.output import OutputSpec
 from pydantic_ai.run import AgentRunResult
 from pydantic_ai.settings import ModelSettings
@@ -40,13 +47,91 @@ from voluntas.logging import (
     log_states,
 )
 from voluntas.usage import BDIUsageTracker
-from voluntas.prompts import build_initial_belief_extraction_prompt
+from voluntas.prompts import (
+    INITIAL_BELIEF_EXTRACTION_INSTRUCTIONS,
+    build_initial_belief_extraction_prompt,
+)
 from voluntas.planning import generate_intentions_from_desires
 from voluntas.execution import execute_intentions
 from voluntas.cycle import bdi_cycle
 
 T = TypeVar("T")
 
+# Cheap signal that a desire states concrete facts (paths, URLs, acronyms, quoted
+# names, numbers, snake_case / dotted identifiers, or capitalized names after a
+# lowercase word) worth extracting as beliefs.
+_FACT_HINT_RE = re.compile(
+    r"(/\S+|https?://|[A-Z]{2,}|`[^`]+`|\"[^\"]+\"|'[^']+'|\d|\w+[_.]\w+"
+    r"|\b[a-z]\w*\s+[A-Z]\w+)"
+)
+
+# Opt-in, in-process LRU of initial belief extractions. Entries hold the JSON
+# form so every hit validates a fresh result instead of sharing one object.
+_BELIEF_EXTRACTION_CACHE: OrderedDict[str, str] = OrderedDict()
+_BELIEF_EXTRACTION_CACHE_SIZE = 128
+
+
+# Shared model-request slots per event loop, keyed by (provider, model name), so
+# every capped agent using the same model draws from one semaphore. The first
+# limit seen for a model on a loop wins; later agents with another limit reuse it.
+_MODEL_SEMAPHORES: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[str, str], asyncio.Semaphore]
+] = weakref.WeakKeyDictionary()
+
+
+def _model_name(model: Any) -> str:
+    return str(getattr(model, "model_name", model) or "")
+
+
+def _prompt_part_key(part: Any) -> str:
+    if isinstance(part, str):
+        return part
+    return getattr(part, "__qualname__", None) or repr(part)
+
+
+def _belief_extraction_cache_key(agent: Agent[Any, Any], desires_text: str) -> str:
+    """Hash everything that shapes the extraction answer for these desires."""
+    model = agent.model
+    parts = [
+        str(getattr(model, "system", "") or ""),
+        _model_name(model),
+        *map(_prompt_part_key, getattr(agent, "_system_prompts", ())),
+        *map(_prompt_part_key, getattr(agent, "_instructions", ())),
+        desires_text,
+    ]
+    return hashlib.sha256("\x00".join(parts).encode()).hexdigest()
+
+
+def _model_semaphore(model: Any, limit: int) -> asyncio.Semaphore:
+    semaphores = _MODEL_SEMAPHORES.setdefault(asyncio.get_running_loop(), {})
+    key = (str(getattr(model, "system", "") or ""), _model_name(model))
+    semaphore = semaphores.get(key)
+    if semaphore is None:
+        semaphore = semaphores[key] = asyncio.Semaphore(limit)
+    return semaphore
+
+
+class _BoundedModel(WrapperModel):
+    """Hold a shared run slot only while a model request is in flight.
+
+    Tool calls run between requests without a slot, so a tool that starts
+    another run on the same model cannot deadlock on the cap.
+    """
+
+    def __init__(self, wrapped: models.Model | str, limit: int) -> None:
+        super().__init__(wrapped)
+        self.limit = limit
+
+    async def request(self, *args: Any, **kwargs: Any) -> ModelResponse:
+        async with _model_semaphore(self.wrapped, self.limit):
+            return await super().request(*args, **kwargs)
+
+    @asynccontextmanager
+    async def request_stream(self, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        async with _model_semaphore(self.wrapped, self.limit):
+            async with super().request_stream(*args, **kwargs) as response_stream:
+                yield response_stream
+
 
 class _MaterializedStreamedRunResult(Generic[T]):
     """Expose a completed streamed run through the regular run-result API."""
@@ -80,12 +165,20 @@ class BDI(Agent, Generic[T]):
         emit_run_events_to_stdout: bool = False,
         stream_model_requests: bool = False,
         output_retries: int = 3,  # Higher default for structured output retries
+        max_concurrency: Optional[int] = None,
+        fast_assess: bool = True,
         **kwargs,
     ):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
         # Pass output_retries to the parent Agent class
         super().__init__(*args, output_retries=output_retries, **kwargs)
         self.beliefs = BeliefSet()
+        # (belief set, version) of the last full verbose belief listing.
+        self._beliefs_logged_at: tuple[BeliefSet, int] | None = None
         self.desires: List[Desire] = []
+        # Desire ID -> position in ``desires``, rebuilt lazily on stale lookups.
+        self._desires_by_id: dict[str, int] = {}
         self.active_intention: Intention | None = None
         self.initial_intention_guidance: List[str] = intentions or []
         self._initial_intention_guidance_consumed = False
@@ -96,7 +189,14 @@ class BDI(Agent, Generic[T]):
         self.usage_tracker = usage_tracker
         self.emit_run_events_to_stdout = emit_run_events_to_stdout
         self.stream_model_requests = stream_model_requests
+        # Cap on in-flight model requests; capped agents using the same provider and
+        # model share one slot pool, sized by the first limit used for it.
+        self.max_concurrency = max_concurrency
+        # Accept clean, substantial tool output without an LLM assessment.
+        self.fast_assess = fast_assess
         self._structured_log_entries: list[dict[str, Any]] = []
+        self._structured_log_lock = asyncio.Lock()
+        self._output_schema_cache: dict[type, Any] = {}
         self.cycle_count = 0
 
         if self.log_file_path:
@@ -110,44 +210,77 @@ class BDI(Agent, Generic[T]):
     def _initialize_string_desires(self, desire_strings: Optional[List[str]]) -> None:
         """Initialize desires from string descriptions.
 
+        Repeated descriptions are collapsed so each distinct desire is
+        planned only once.
+
         Args:
             desire_strings: List of desire description strings
         """
-        for desire_string in desire_strings or []:
-            desire = Desire(
+        self.desires.extend(
+            Desire(
                 id=generate_desire_id(desire_string),
                 description=desire_string,
                 priority=0.5,
             )
-            self.desires.append(desire)
-        log_states(self, ["desires"])
+            for desire_string in dict.fromkeys(desire_strings or [])
+        )
+        if self.desires:
+            log_states(self, ["desires"])
 
-    async def extract_beliefs_from_desires(self) -> None:
+    async def extract_beliefs_from_desires(
+        self, *, cache: bool = False, skip_without_fact_hints: bool = False
+    ) -> None:
         """Extract factual information from desire descriptions and add to beliefs.
 
         This method analyzes desire descriptions to extract concrete facts that should
         be recorded as initial beliefs, avoiding the need to rediscover this information
-        during execution.
+        during execution. With ``cache`` enabled, an extraction made earlier in this
+        process for the same provider, model, system prompts, instructions and desires
+        text is reused instead of calling the model again.
+
+        With ``skip_without_fact_hints`` enabled, the model call is skipped when no
+        desire contains anything that looks like a concrete fact. The heuristic can
+        miss facts stated in plain words, so it is off by default.
         """
         if not self.desires:
             return
 
-        desires_text = "\n".join([f"- {d.description}" for d in self.desires])
-
-        belief_extraction_prompt = build_initial_belief_extraction_prompt(desires_text)
+        if skip_without_fact_hints and not any(
+            _FACT_HINT_RE.search(d.description) for d in self.desires
+        ):
+            if self.verbose:
+                print(
+                    f"{bcolors.BELIEF}No concrete facts in desires; skipping initial belief extraction.{bcolors.ENDC}"
+                )
+            return
 
-        try:
-            extraction_result = await self.run(
-                belief_extraction_prompt, output_type=BeliefExtractionResult
+        desires_text = "- " + "\n- ".join([d.description for d in self.desires])
+        cache_key = _belief_extraction_cache_key(self, desires_text) if cache else None
+        extraction = None
+        if cache_key and cache_key in _BELIEF_EXTRACTION_CACHE:
+            _BELIEF_EXTRACTION_CACHE.move_to_end(cache_key)
+            extraction = BeliefExtractionResult.model_validate_json(
+                _BELIEF_EXTRACTION_CACHE[cache_key]
             )
 
-            if (
-                extraction_result
-                and extraction_result.output
-                and extraction_result.output.beliefs
-            ):
+        try:
+            if extraction is None:
+                extraction_result = await self.run(
+                    build_initial_belief_extraction_prompt(desires_text),
+                    output_type=BeliefExtractionResult,
+                    instructions=INITIAL_BELIEF_EXTRACTION_INSTRUCTIONS,
+                )
+                if not (extraction_result and extraction_result.output):
+                    return
+                extraction = extraction_result.output
+                if cache_key:
+                    _BELIEF_EXTRACTION_CACHE[cache_key] = extraction.model_dump_json()
+                    if len(_BELIEF_EXTRACTION_CACHE) > _BELIEF_EXTRACTION_CACHE_SIZE:
+                        _BELIEF_EXTRACTION_CACHE.popitem(last=False)
+
+            if extraction.beliefs:
                 update_stats = await update_beliefs_from_desire_extraction(
-                    self, extraction_result.output.beliefs
+                    self, extraction.beliefs
                 )
 
                 if self.verbose:
@@ -168,6 +301,26 @@ class BDI(Agent, Generic[T]):
                     f"{bcolors.WARNING}Could not extract beliefs from desires: {e}{bcolors.ENDC}"
                 )
 
+    @classmethod
+    async def batch_extract_beliefs_from_desires(
+        cls, agents: Sequence["BDI"], *, max_concurrency: int = 8
+    ) -> None:
+        """Extract initial beliefs for several agents concurrently.
+
+        Each agent keeps its own extraction prompt and belief store; at most
+        ``max_concurrency`` extraction requests are in flight at once.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _extract(agent: "BDI") -> None:
+            async with semaphore:
+                await agent.extract_beliefs_from_desires()
+
+        await asyncio.gather(*(_extract(agent) for agent in agents))
+
     def _initialize_log_file(self) -> None:
         """Initialize terminal-mirrored log file."""
         if not self.log_file_path:
@@ -216,21 +369,35 @@ class BDI(Agent, Generic[T]):
             )
             self.structured_log_file_path = None
 
-    def _persist_structured_log_entries(self) -> None:
-        """Rewrite the structured run log JSON file."""
+    async def _persist_structured_log_entries(self) -> None:
+        """Rewrite the structured run log JSON file off the event loop.
+
+        Serialization and the write both run in a worker thread on a snapshot
+        of the entries. Writes are serialized so a later snapshot is never
+        overwritten by an earlier one.
+        """
         if not self.structured_log_file_path:
             return
 
-        try:
-            with open(self.structured_log_file_path, "w", encoding="utf-8") as f:
-                json.dump(self._structured_log_entries, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(
-                f"{bcolors.WARNING}Failed to persist structured log at {self.structured_log_file_path}: {e}{bcolors.ENDC}"
-            )
-            self.structured_log_file_path = None
+        async with self._structured_log_lock:
+            log_path = self.structured_log_file_path
+            if not log_path:
+                return
+            entries = list(self._structured_log_entries)
+
+            def _write() -> None:
+                payload = json.dumps(entries, ensure_ascii=False, indent=2)
+                Path(log_path).write_text(payload, encoding="utf-8")
 
-    def _record_structured_run(
+            try:
+                await asyncio.to_thread(_write)
+            except Exception as e:
+                print(
+                    f"{bcolors.WARNING}Failed to persist structured log at {log_path}: {e}{bcolors.ENDC}"
+                )
+                self.structured_log_file_path = None
+
+    async def _record_structured_run(
         self,
         user_prompt: str | Sequence[UserContent] | None,
         result: AgentRunResult[Any],
@@ -243,7 +410,7 @@ class BDI(Agent, Generic[T]):
             model_name=model_name,
         )
         self._structured_log_entries.append(entry)
-        self._persist_structured_log_entries()
+        await self._persist_structured_log_entries()
         if self.emit_run_events_to_stdout:
             self._emit_stdout_run_event(entry)
 
@@ -276,6 +443,24 @@ class BDI(Agent, Generic[T]):
 
         self.usage_tracker.record_result(result, attributes=self._usage_attributes())
 
+    def _prepare_output_schema(self, output_type: OutputSpec[Any] | None) -> Any:
+        """Reuse the output schema built for a plain output class across runs.
+
+        BDI runs request the same handful of structured output models every
+        cycle, so the schema is built once per agent instead of once per run.
+        Mirrors ``Agent._prepare_output_schema`` as of the pinned pydantic-ai
+        1.41: output validators still go through the base method so it can
+        reject a custom run ``output_type``.
+        """
+        if not isinstance(output_type, type) or self._output_validators:
+            return super()._prepare_output_schema(output_type)
+
+        schema = self._output_schema_cache.get(output_type)
+        if schema is None:
+            schema = super()._prepare_output_schema(output_type)
+            self._output_schema_cache[output_type] = schema
+        return schema
+
     @overload
     async def run(
         self,
@@ -341,6 +526,9 @@ class BDI(Agent, Generic[T]):
         event_stream_handler: EventStreamHandler[Any] | None = None,
     ) -> AgentRunResult[Any]:
         """Run the underlying Pydantic AI agent and capture a structured log entry."""
+        run_model = model or self.model
+        if self.max_concurrency is not None and run_model is not None:
+            model = _BoundedModel(run_model, self.max_concurrency)
         if self.stream_model_requests:
             async with super().run_stream(
                 user_prompt=user_prompt,
@@ -388,7 +576,7 @@ class BDI(Agent, Generic[T]):
             )
 
         try:
-            self._record_structured_run(user_prompt, result)
+            await self._record_structured_run(user_prompt, result)
         except Exception as e:
             print(
                 f"{bcolors.WARNING}Failed to capture structured run log entry: {e}{bcolors.ENDC}"
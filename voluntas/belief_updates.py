@@ -1,6 +1,7 @@
 """Centralized belief update helpers for BDI flows."""
 
 import json
+import time
 from difflib import SequenceMatcher
 from textwrap import dedent
 from typing import TYPE_CHECKING, Any, Dict, Iterable, Literal, Tuple, cast
@@ -102,8 +103,13 @@ def _belief_name_tokens(name: str) -> set[str]:
     }
 
 
-def _is_potential_name_match(incoming_name: str, existing_name: str) -> bool:
-    incoming_tokens = _belief_name_tokens(incoming_name)
+def _is_potential_name_match(
+    incoming_name: str,
+    existing_name: str,
+    incoming_tokens: set[str] | None = None,
+) -> bool:
+    if incoming_tokens is None:
+        incoming_tokens = _belief_name_tokens(incoming_name)
     existing_tokens = _belief_name_tokens(existing_name)
     shared_tokens = incoming_tokens & existing_tokens
 
@@ -115,11 +121,12 @@ def _is_potential_name_match(incoming_name: str, existing_name: str) -> bool:
 
 
 def _ambiguous_existing_names(agent: "BDI", incoming_name: str) -> list[str]:
+    incoming_tokens = _belief_name_tokens(incoming_name)
     return [
         existing_name
         for existing_name in agent.beliefs.beliefs
         if existing_name != incoming_name
-        and _is_potential_name_match(incoming_name, existing_name)
+        and _is_potential_name_match(incoming_name, existing_name, incoming_tokens)
     ]
 
 
@@ -246,6 +253,7 @@ def _apply_resolved_belief_update(
     certainty_to_store: float,
     source: str,
     should_update: bool,
+    timestamp: float,
 ) -> Tuple[str, Any, float, BeliefMutation]:
     if not should_update:
         existing = agent.beliefs.get(belief_name)
@@ -260,6 +268,7 @@ def _apply_resolved_belief_update(
             value=value_to_store,
             source=source,
             certainty=certainty_to_store,
+            timestamp=timestamp,
         ),
     )
     stored = agent.beliefs.get(belief_name)
@@ -281,12 +290,14 @@ async def _apply_belief_batch(
             _stable_value_key(belief["value"])
         )
 
+    get_belief = agent.beliefs.get
+    timestamp = time.time()
     for index, belief_dict in enumerate(prepared):
         belief_name = belief_dict["name"]
         incoming_value = belief_dict["value"]
         incoming_certainty = belief_dict["certainty"]
         source = belief_dict["source"]
-        existing = agent.beliefs.get(belief_name)
+        existing = get_belief(belief_name)
 
         if (existing and existing.value != incoming_value) or len(
             values_by_name[belief_name]
@@ -329,11 +340,13 @@ async def _apply_belief_batch(
                 certainty_to_store=incoming_certainty,
                 source=source,
                 should_update=True,
+                timestamp=timestamp,
             )
         )
 
     if pending_resolution:
         decisions = await _llm_resolve_belief_updates_batch(agent, pending_resolution)
+        timestamp = time.time()
         for pending_belief in pending_resolution:
             belief_name, should_update, value_to_store, certainty_to_store = (
                 decisions.get(pending_belief["index"])
@@ -347,12 +360,14 @@ async def _apply_belief_batch(
                     certainty_to_store=certainty_to_store,
                     source=pending_belief["source"],
                     should_update=should_update,
+                    timestamp=timestamp,
                 )
             )
 
+    verbose = agent.verbose
     for belief_name, value_to_store, certainty_to_store, mutation in applied_results:
         stats[mutation] += 1
-        if agent.verbose:
+        if verbose:
             print(
                 f"{bcolors.BELIEF}    {_mutation_marker(mutation)} {belief_name}: {value_to_store} (Certainty: {certainty_to_store:.2f}) [{mutation}]{bcolors.ENDC}"
             )
@@ -4,16 +4,18 @@ This module implements the main BDI reasoning cycle that coordinates belief upda
 deliberation, intention generation, execution, and plan monitoring.
 """
 
+import asyncio
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 from voluntas._utils import bcolors
-from voluntas.schemas import DesireStatus, Desire, generate_desire_id
+from voluntas.schemas import Desire, generate_desire_id
 from voluntas.io_helpers import is_exit_command
 from voluntas.logging import log_states
 from voluntas.planning import generate_intentions_from_desires
 from voluntas.execution import ExecutionOutcome, ExecutionOutcomeKind, execute_intentions
 from voluntas.monitoring import reconsider_current_intention
-from voluntas.state_transitions import all_desires_terminal
+from voluntas.state_transitions import all_desires_terminal, has_active_desires
 
 if TYPE_CHECKING:
     from voluntas.agent import BDI
@@ -91,15 +93,9 @@ async def bdi_cycle(agent: "BDI") -> str:
     if agent.verbose:
         print(f"{bcolors.DESIRE}Current Desires:{bcolors.ENDC}")
         log_states(agent, ["desires"])
-    active_desires = [
-        d
-        for d in agent.desires
-        if d.status in [DesireStatus.PENDING, DesireStatus.ACTIVE]
-    ]
-
     # 3. Intention Generation (if needed)
     # If we have active/pending desires but no intentions queued, generate them.
-    if active_desires and agent.active_intention is None:
+    if agent.active_intention is None and has_active_desires(agent):
         print(
             f"{bcolors.SYSTEM}No current intentions, but active/pending desires exist. Generating intentions...{bcolors.ENDC}"
         )
@@ -210,8 +206,65 @@ async def bdi_cycle(agent: "BDI") -> str:
     return "executed"
 
 
+async def run_cycles_parallel(
+    agents: Sequence["BDI"],
+    cycles: int = 1,
+    *,
+    max_concurrency: int = 32,
+) -> list[list[str]]:
+    """Run BDI cycles for independent agents concurrently.
+
+    Each agent runs up to ``cycles`` cycles in order, stopping early on a final
+    status, while at most ``max_concurrency`` agents are cycling at once. If any
+    agent raises, the other agents' cycles are cancelled and awaited before the
+    first exception propagates.
+
+    Human-in-the-loop prompts (the idle prompt and failure interventions) read
+    the terminal with blocking ``input()``, which would stall every agent on the
+    event loop and interleave prompts, so agents must have
+    ``enable_human_in_the_loop`` disabled.
+
+    Returns:
+        The cycle statuses of each agent, in the order the agents were given.
+
+    Raises:
+        ValueError: If ``max_concurrency`` is below 1, an agent is listed twice,
+            or an agent has human-in-the-loop enabled.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    if len({id(agent) for agent in agents}) != len(agents):
+        raise ValueError("each agent may only be listed once")
+    if any(agent.enable_human_in_the_loop for agent in agents):
+        raise ValueError(
+            "run_cycles_parallel does not support agents with human-in-the-loop enabled"
+        )
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run_agent(agent: "BDI") -> list[str]:
+        statuses: list[str] = []
+        async with semaphore:
+            for _ in range(cycles):
+                status = await bdi_cycle(agent)
+                statuses.append(status)
+                if is_final_cycle_status(status):
+                    break
+        return statuses
+
+    tasks = [asyncio.ensure_future(_run_agent(agent)) for agent in agents]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 __all__ = [
     "FINAL_CYCLE_STATUSES",
     "bdi_cycle",
     "is_final_cycle_status",
+    "run_cycles_parallel",
 ]
@@ -9,22 +9,25 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 import traceback
-import json
 from types import SimpleNamespace
 
+from pydantic_core import to_json
+
 from voluntas._utils import bcolors
 from voluntas.schemas import (
     PlanStep,
     BeliefExtractionResult,
-    StepAssessmentResult,
+    StepAnalysisResult,
 )
 from voluntas.errors import is_validation_output_error
 from voluntas.belief_updates import update_beliefs_from_step_extraction
 from voluntas.logging import log_states, format_beliefs_for_context
 from voluntas.monitoring import generate_history_context
 from voluntas.prompts import (
+    STEP_ANALYSIS_INSTRUCTIONS,
+    STEP_BELIEF_EXTRACTION_INSTRUCTIONS,
     build_descriptive_execution_prompt,
-    build_step_assessment_prompt,
+    build_step_analysis_prompt,
     build_step_belief_extraction_prompt,
     build_tool_execution_prompt,
 )
@@ -37,6 +40,17 @@ if TYPE_CHECKING:
 # Fixed retry configuration - opinionated approach
 MAX_STEP_RETRIES = 2  # Total of 3 attempts per step
 
+# Tool output heuristics shared by the assessment fast path and its fallback
+TOOL_ERROR_INDICATORS = (
+    "error",
+    "exception",
+    "failed to",
+    "could not",
+    "not found",
+    "does not exist",
+)
+MIN_SUBSTANTIAL_TOOL_OUTPUT = 50
+
 
 class ExecutionOutcomeKind(str, Enum):
     NO_INTENTION = "no_intention"
@@ -126,7 +140,9 @@ async def extract_relevant_beliefs_from_result(
 
     try:
         extraction_result = await agent.run(
-            belief_extraction_prompt, output_type=BeliefExtractionResult
+            belief_extraction_prompt,
+            output_type=BeliefExtractionResult,
+            instructions=STEP_BELIEF_EXTRACTION_INSTRUCTIONS,
         )
 
         if (
@@ -167,110 +183,85 @@ async def extract_relevant_beliefs_from_result(
     return extracted_beliefs
 
 
-async def analyze_step_outcome_and_update_beliefs(
-    agent: "BDI",
-    step: PlanStep,
-    result: Optional["AgentRunResult"],
-    extracted_beliefs_out: Optional[List[Dict[str, Any]]] = None,
-) -> bool:
-    """Analyze the outcome of an executed step, updates beliefs, and determines success.
-
-    Args:
-        agent: The BDI agent instance
-        step: The PlanStep that was executed
-        result: The result returned by the base Agent's run method
-
-    Returns:
-        True if the step is considered successful, False otherwise
-    """
-    if agent.verbose:
-        print(f"{bcolors.SYSTEM}  Analyzing step outcome...{bcolors.ENDC}")
-    if not result:
-        print(
-            f"{bcolors.WARNING}  Analysis: Step failed - No result returned.{bcolors.ENDC}"
-        )
+def _tool_output_looks_successful(output: str) -> bool:
+    """Return True when tool output is substantial and carries no error markers."""
+    if len(output) <= MIN_SUBSTANTIAL_TOOL_OUTPUT:
         return False
+    output_lower = output.lower()
+    return not any(indicator in output_lower for indicator in TOOL_ERROR_INDICATORS)
 
-    if agent.verbose:
-        print(
-            f"{bcolors.SYSTEM}  (Belief update check based on result: {result.output}){bcolors.ENDC}"
-        )
 
-    # Get history context
-    intention = agent.active_intention
-    if intention is None:
-        return False
-    history_context = generate_history_context(intention)
-
-    # --- Success Assessment (using LLM) ---
+async def _analyze_step_with_llm(
+    agent: "BDI",
+    step: PlanStep,
+    result: "AgentRunResult",
+    history_context: str,
+) -> tuple[bool, List[Dict[str, Any]]]:
+    """Assess a step and extract its beliefs in one LLM call, with a local fallback."""
     step_type = (
         f"Tool call: {step.tool_name}"
         if step.is_tool_call and step.tool_name
         else "Descriptive step"
     )
-    assessment_prompt = build_step_assessment_prompt(
+    analysis_prompt = build_step_analysis_prompt(
         step.description,
         result.output,
         step_type,
         history_context,
+        format_beliefs_for_context(agent),
     )
 
     step_success = False
+    extracted_beliefs: List[Dict[str, Any]] = []
     try:
-        assessment_result = await agent.run(
-            assessment_prompt, output_type=StepAssessmentResult
+        analysis_result = await agent.run(
+            analysis_prompt,
+            output_type=StepAnalysisResult,
+            instructions=STEP_ANALYSIS_INSTRUCTIONS,
         )
-        if (
-            assessment_result
-            and assessment_result.output
-            and assessment_result.output.success
-        ):
+        analysis = analysis_result.output if analysis_result else None
+        if analysis and analysis.success:
             if agent.verbose:
                 print(
                     f"{bcolors.SYSTEM}  LLM Assessment: Step SUCCEEDED.{bcolors.ENDC}"
                 )
-                if assessment_result.output.reason:
-                    print(
-                        f"{bcolors.SYSTEM}  Reason: {assessment_result.output.reason}{bcolors.ENDC}"
-                    )
+                if analysis.reason:
+                    print(f"{bcolors.SYSTEM}  Reason: {analysis.reason}{bcolors.ENDC}")
             step_success = True
         else:
             reason = (
-                assessment_result.output.reason
-                if (
-                    assessment_result
-                    and assessment_result.output
-                    and assessment_result.output.reason
-                )
+                analysis.reason
+                if analysis and analysis.reason
                 else "No assessment result or negative assessment"
             )
             print(
                 f"{bcolors.WARNING}  LLM Assessment: Step FAILED. Reason: {reason}{bcolors.ENDC}"
             )
-            step_success = False
+
+        if analysis and analysis.beliefs:
+            extracted_beliefs = [
+                {
+                    "name": belief.name,
+                    "value": belief.value,
+                    "certainty": belief.certainty,
+                }
+                for belief in analysis.beliefs
+            ]
+            if agent.verbose:
+                print(
+                    f"{bcolors.BELIEF}  Extracted {len(extracted_beliefs)} belief(s).{bcolors.ENDC}"
+                )
 
     except Exception as assess_e:
         print(
             f"{bcolors.FAIL}  Error during LLM success assessment: {assess_e}{bcolors.ENDC}"
         )
 
-        # INTELLIGENT FALLBACK: Don't default to failure
-        # For tool calls, check if the result contains error indicators
+        # Tool output can still reach this point when the fast path was skipped
+        # (fast_assess disabled or no captured tool result), so fall back to the
+        # same substantial-and-error-free heuristic the fast path uses.
         if step.is_tool_call and result and result.output:
-            error_indicators = [
-                "error",
-                "exception",
-                "failed to",
-                "could not",
-                "not found",
-                "does not exist",
-            ]
-            result_lower = result.output.lower()
-
-            has_error = any(indicator in result_lower for indicator in error_indicators)
-            has_substantial_output = len(result.output) > 50
-
-            if not has_error and has_substantial_output:
+            if _tool_output_looks_successful(result.output):
                 print(
                     f"{bcolors.SYSTEM}  Fallback: Tool call returned substantial data without errors - marking as SUCCESS.{bcolors.ENDC}"
                 )
@@ -286,12 +277,71 @@ async def analyze_step_outcome_and_update_beliefs(
                 f"{bcolors.WARNING}  Fallback: Cannot assess non-tool step - marking as FAILURE.{bcolors.ENDC}"
             )
             step_success = False
+        # Failure constraints are still worth recording, so extraction runs
+        # on its own when the combined call could not produce them.
+        extracted_beliefs = await extract_relevant_beliefs_from_result(
+            agent, step, result, step_success
+        )
 
-    # --- Belief Extraction ---
-    # Extract beliefs from the step result regardless of success/failure
-    extracted_beliefs = await extract_relevant_beliefs_from_result(
-        agent, step, result, step_success
-    )
+    return step_success, extracted_beliefs
+
+
+async def analyze_step_outcome_and_update_beliefs(
+    agent: "BDI",
+    step: PlanStep,
+    result: Optional["AgentRunResult"],
+    extracted_beliefs_out: Optional[List[Dict[str, Any]]] = None,
+) -> bool:
+    """Analyze the outcome of an executed step, updates beliefs, and determines success.
+
+    Args:
+        agent: The BDI agent instance
+        step: The PlanStep that was executed
+        result: The result returned by the base Agent's run method
+
+    Returns:
+        True if the step is considered successful, False otherwise
+    """
+    if agent.verbose:
+        print(f"{bcolors.SYSTEM}  Analyzing step outcome...{bcolors.ENDC}")
+    if not result:
+        print(
+            f"{bcolors.WARNING}  Analysis: Step failed - No result returned.{bcolors.ENDC}"
+        )
+        return False
+
+    if agent.verbose:
+        print(
+            f"{bcolors.SYSTEM}  (Belief update check based on result: {result.output}){bcolors.ENDC}"
+        )
+
+    intention = agent.active_intention
+    if intention is None:
+        return False
+
+    # --- Success Assessment ---
+    # Clean, substantial tool output is accepted without an LLM round-trip.
+    if (
+        getattr(agent, "fast_assess", True)
+        and step.is_tool_call
+        and getattr(result, "tool_result_captured", False)
+        and _tool_output_looks_successful(result.output)
+    ):
+        if agent.verbose:
+            print(
+                f"{bcolors.SYSTEM}  Tool call returned substantial data without errors - marking as SUCCESS.{bcolors.ENDC}"
+            )
+        step_success = True
+        # --- Belief Extraction ---
+        extracted_beliefs = await extract_relevant_beliefs_from_result(
+            agent, step, result, step_success
+        )
+    else:
+        # Assessment and belief extraction share the step context, so one
+        # structured call returns both instead of paying for two round-trips.
+        step_success, extracted_beliefs = await _analyze_step_with_llm(
+            agent, step, result, generate_history_context(intention)
+        )
     if extracted_beliefs_out is not None:
         extracted_beliefs_out.extend(extracted_beliefs)
 
@@ -317,11 +367,24 @@ async def analyze_step_outcome_and_update_beliefs(
     return step_success
 
 
-def _snapshot_beliefs(agent: "BDI") -> Dict[str, Dict[str, Any]]:
-    return {
+def _record_step_outcome(
+    agent: "BDI", plan, step: PlanStep, result: str, success: bool
+) -> bool:
+    """Record a step outcome with the beliefs changed since the previous entry.
+
+    The first entry of a Plan captures every belief; later entries only carry
+    beliefs created or modified since the preceding entry was recorded.
+    """
+    since = plan.step_history[-1].beliefs_version if plan.step_history else 0
+    beliefs_updated = {
         name: {"value": b.value, "source": b.source, "certainty": b.certainty}
-        for name, b in agent.beliefs.beliefs.items()
+        for name, b in agent.beliefs.changed_since(since).items()
     }
+    version = agent.beliefs.version
+    if success:
+        return plan.record_outcome_and_advance(step, result, beliefs_updated, version)
+    plan.record_failure(step, result, beliefs_updated, version)
+    return False
 
 
 def _build_retry_context(retry_ctx: StepRetryContext) -> str:
@@ -332,7 +395,7 @@ def _build_retry_context(retry_ctx: StepRetryContext) -> str:
     for failure in retry_ctx.failure_history:
         lines.append(f"- Attempt {failure['attempt'] + 1}: {failure['result']}")
         if failure["beliefs"]:
-            lines.append(f"  Beliefs learned: {json.dumps(failure['beliefs'])}")
+            lines.append(f"  Beliefs learned: {to_json(failure['beliefs'], fallback=str).decode()}")
     lines.append("")
     lines.append("Please consider these failures and adjust your approach accordingly.")
     return "\n".join(lines) + "\n"
@@ -437,7 +500,12 @@ async def _run_step_attempt(
             f"{bcolors.SYSTEM}  Tool '{current_step.tool_name}' result: {effective_output}{bcolors.ENDC}"
         )
         _log_tool_debug_messages(agent, step_result)
-        return SimpleNamespace(output=effective_output)
+        # Only raw tool output may skip the LLM assessment; the model's own
+        # narrative (e.g. explaining why it could not call the tool) may not.
+        return SimpleNamespace(
+            output=effective_output,
+            tool_result_captured=bool(extracted_tool_output),
+        )
 
     if agent.verbose:
         print(
@@ -467,10 +535,8 @@ def _handle_step_execution_exception(
     traceback.print_exc()
 
     plan = intention.active_plan
-    plan.record_failure(
-        current_step,
-        f"Exception: {str(error)}",
-        _snapshot_beliefs(agent),
+    _record_step_outcome(
+        agent, plan, current_step, f"Exception: {str(error)}", success=False
     )
 
     print(
@@ -546,9 +612,7 @@ async def _handle_successful_step(
     agent: "BDI", intention, current_step: PlanStep, result: str
 ) -> ExecutionOutcome:
     plan = intention.active_plan
-    completed = plan.record_outcome_and_advance(
-        current_step, result, _snapshot_beliefs(agent)
-    )
+    completed = _record_step_outcome(agent, plan, current_step, result, success=True)
 
     if completed:
         print(
@@ -605,10 +669,12 @@ async def _handle_failed_step(
         )
 
     log_states(agent, ["beliefs"])
-    plan.record_failure(
+    _record_step_outcome(
+        agent,
+        plan,
         current_step,
         step_result.output if step_result else "No result",
-        _snapshot_beliefs(agent),
+        success=False,
     )
     print(
         f"{bcolors.WARNING}  Plan marked failed; plan-level reconsideration will decide whether to continue, repair, replace, or fail the Desire.{bcolors.ENDC}"
@@ -5,8 +5,9 @@ to intervene when the agent encounters failures, providing guidance that gets
 interpreted via LLM and applied to modify the agent's plan.
 """
 
+from collections.abc import Hashable
 from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple
-from datetime import datetime
+from functools import lru_cache
 import traceback
 import json
 
@@ -18,8 +19,11 @@ from voluntas.schemas import (
     DesireStatus,
 )
 from voluntas.io_helpers import is_exit_command
-from voluntas.logging import log_states
-from voluntas.prompts import build_hitl_interpretation_prompt
+from voluntas.logging import format_timestamp_iso, log_states
+from voluntas.prompts import (
+    build_hitl_interpretation_prompt,
+    serialize_failure_context,
+)
 from voluntas.state_transitions import (
     complete_intention_and_update_desire,
     remove_intention,
@@ -32,6 +36,9 @@ if TYPE_CHECKING:
     from voluntas.schemas import Intention
 
 
+_FAIL_BANNER = f"{bcolors.FAIL}{'-' * 60}{bcolors.ENDC}"
+
+
 def build_failure_context(
     agent: "BDI",
     intention: "Intention",
@@ -51,6 +58,11 @@ def build_failure_context(
     """
     plan = intention.active_plan
     current_plan_step = plan.current_step()
+    # Dump every Plan Step once and share the dicts across context fields.
+    step_dumps = [step.model_dump() for step in plan.steps]
+    current_step_dump = (
+        step_dumps[plan.current_step_index] if current_plan_step else None
+    )
     context = {
         "desire_id": intention.desire_id,
         "intention_description": intention.description,
@@ -58,11 +70,9 @@ def build_failure_context(
             "status": plan.status.value,
             "current_step_index": plan.current_step_index,
             "total_steps": len(plan.steps),
-            "steps": [step.model_dump() for step in plan.steps],
+            "steps": step_dumps,
         },
-        "current_plan_step": current_plan_step.model_dump()
-        if current_plan_step
-        else None,
+        "current_plan_step": current_step_dump,
         "plan_status": plan.status.value,
         "failed_step_description": failed_step.description,
         "failed_step_number": plan.current_step_index + 1,
@@ -81,23 +91,19 @@ def build_failure_context(
                 "value": b.value,
                 "source": b.source,
                 "certainty": b.certainty,
-                "timestamp": datetime.fromtimestamp(b.timestamp).isoformat(),
+                "timestamp": format_timestamp_iso(b.timestamp),
             }
             for name, b in agent.beliefs.beliefs.items()
         }
         if agent.beliefs.beliefs
         else "No current beliefs.",
-        "remaining_plan_steps": [
-            {
-                "description": s.description,
-                "is_tool_call": s.is_tool_call,
-                "tool_name": s.tool_name,
-                "tool_params": s.tool_params,
-            }
-            for s in plan.remaining_steps_after_current()
-        ],
-        "original_failed_step_object": failed_step.model_dump(),
+        "remaining_plan_steps": step_dumps[plan.current_step_index + 1 :],
+        "original_failed_step_object": current_step_dump
+        if failed_step is current_plan_step
+        else failed_step.model_dump(),
     }
+    # Serialized once so re-interpretations (e.g. on "edit") reuse the JSON.
+    context["serialized"] = serialize_failure_context(context)
     return context
 
 
@@ -107,50 +113,86 @@ def present_context_to_user(failure_context: Dict[str, Any]) -> None:
     Args:
         failure_context: Dictionary containing failure information
     """
-    print(
-        f"{bcolors.FAIL}------------------------------------------------------------{bcolors.ENDC}"
-    )
-    print(
-        f"{bcolors.FAIL}HUMAN INTERVENTION REQUIRED for Desire '{failure_context['desire_id']}'{bcolors.ENDC}"
-    )
-    print(
-        f"{bcolors.FAIL}------------------------------------------------------------{bcolors.ENDC}"
-    )
-    print(
-        f"Failed Plan Step ({failure_context['failed_step_number']}/{failure_context['total_steps_in_plan']}): {failure_context['failed_step_description']}"
-    )
-    print(
-        f"Active Plan: {failure_context['active_plan']['status']} at Plan Step {failure_context['failed_step_number']}/{failure_context['total_steps_in_plan']}"
-    )
+    lines = [
+        _FAIL_BANNER,
+        f"{bcolors.FAIL}HUMAN INTERVENTION REQUIRED for Desire '{failure_context['desire_id']}'{bcolors.ENDC}",
+        _FAIL_BANNER,
+        f"Failed Plan Step ({failure_context['failed_step_number']}/{failure_context['total_steps_in_plan']}): {failure_context['failed_step_description']}",
+        f"Active Plan: {failure_context['active_plan']['status']} at Plan Step {failure_context['failed_step_number']}/{failure_context['total_steps_in_plan']}",
+    ]
     if failure_context["is_tool_call"]:
-        print(
+        lines.append(
             f"  Tool Call: {failure_context['tool_name']}({json.dumps(failure_context['tool_params']) if failure_context['tool_params'] else '{}'})"
         )
 
-    print(f"Plan Step Result Data: {failure_context['step_result_output']}")
-
-    print(f"Agent Assessment: {failure_context['llm_step_assessment']}")
+    lines.append(f"Plan Step Result Data: {failure_context['step_result_output']}")
+    lines.append(f"Agent Assessment: {failure_context['llm_step_assessment']}")
 
-    print("\nCurrent Beliefs:")
+    lines.append("\nCurrent Beliefs:")
     if isinstance(failure_context["current_beliefs"], dict):
         if failure_context["current_beliefs"]:
             for name, b_details in failure_context["current_beliefs"].items():
-                print(
+                lines.append(
                     f"  - {name}: {b_details['value']} (Source: {b_details['source']}, Certainty: {b_details['certainty']:.2f}, Time: {b_details['timestamp']})"
                 )
         else:
-            print("  (None)")
+            lines.append("  (None)")
     else:
-        print(f"  {failure_context['current_beliefs']}")
+        lines.append(f"  {failure_context['current_beliefs']}")
 
     if failure_context["remaining_plan_steps"]:
-        print("\nRemaining Plan Steps:")
+        lines.append("\nRemaining Plan Steps:")
         for i, step_data in enumerate(failure_context["remaining_plan_steps"]):
-            print(f"  {i + 1}. {step_data['description']}")
+            lines.append(f"  {i + 1}. {step_data['description']}")
     else:
-        print("\nNo remaining steps in this plan.")
-    print(
-        f"{bcolors.FAIL}------------------------------------------------------------{bcolors.ENDC}"
+        lines.append("\nNo remaining steps in this plan.")
+    lines.append(_FAIL_BANNER)
+
+    # One write per block keeps the mirrored log and terminal lock traffic low.
+    print("\n".join(lines))
+
+
+def _build_tool_description(tool_config: Any) -> str:
+    if hasattr(tool_config, "model_json_schema"):
+        return f"Input schema: {json.dumps(tool_config.model_json_schema().get('properties', {}))}"
+    if callable(tool_config):
+        docstring = getattr(tool_config, "__doc__", "No description.")
+        return f"Description: {docstring.strip() if docstring else 'N/A'}"
+    return "Schema: (provided by system)"
+
+
+# Tool schemas do not change between HITL calls; build each description once.
+_cached_tool_description = lru_cache(maxsize=128)(_build_tool_description)
+
+
+def _describe_tool_config(tool_config: Any) -> str:
+    if isinstance(tool_config, Hashable):
+        return _cached_tool_description(tool_config)
+    return _build_tool_description(tool_config)
+
+
+_FAST_DIRECTIVE_COMMANDS = {
+    "retry": "RETRY_CURRENT_AS_IS",
+    "r": "RETRY_CURRENT_AS_IS",
+    "skip": "SKIP_CURRENT_STEP",
+    "s": "SKIP_CURRENT_STEP",
+    "abort": "ABORT_INTENTION",
+    "a": "ABORT_INTENTION",
+    "kill": "ABORT_INTENTION",
+}
+
+
+def _fast_directive_from_input(
+    user_input: str,
+) -> Optional[PlanManipulationDirective]:
+    """Map a bare retry/skip/abort command to a directive without an LLM call."""
+    command = user_input.strip().lower()
+    manipulation_type = _FAST_DIRECTIVE_COMMANDS.get(command)
+    if manipulation_type is None:
+        return None
+    return PlanManipulationDirective(
+        manipulation_type=manipulation_type,
+        user_guidance_summary=f"User issued the '{command}' command directly.",
     )
 
 
@@ -175,21 +217,14 @@ async def interpret_user_nl_guidance(
     # Get available tool descriptions if possible
     tools_description_for_llm = "Available tools will be provided by the system. Focus on their general capabilities if specific schemas aren't listed here."
     if hasattr(agent, "tool_configs") and agent.tool_configs:
-        tools_list = []
-        for tool_name, tool_config in agent.tool_configs.items():
-            schema_info = "Schema: (provided by system)"
-            if hasattr(tool_config, "model_json_schema"):
-                schema_info = f"Input schema: {json.dumps(tool_config.model_json_schema().get('properties', {}))}"
-            elif callable(tool_config):
-                docstring = getattr(tool_config, "__doc__", "No description.")
-                schema_info = (
-                    f"Description: {docstring.strip() if docstring else 'N/A'}"
-                )
-            tools_list.append(f"- {tool_name}: {schema_info}")
+        tools_list = [
+            f"- {tool_name}: {_describe_tool_config(tool_config)}"
+            for tool_name, tool_config in agent.tool_configs.items()
+        ]
         if tools_list:
             tools_description_for_llm = (
-                "Available Tools (use these for new steps if applicable):\\n"
-                + "\\n".join(tools_list)
+                "Available Tools (use these for new steps if applicable):\n"
+                + "\n".join(tools_list)
             )
 
     prompt = build_hitl_interpretation_prompt(
@@ -209,7 +244,7 @@ async def interpret_user_nl_guidance(
         if llm_response and llm_response.output:
             if agent.verbose:
                 print(
-                    f"{bcolors.SYSTEM}  LLM interpretation successful. Directive: {llm_response.output.model_dump_json(indent=2)}{bcolors.ENDC}"
+                    f"{bcolors.SYSTEM}  LLM interpretation successful. Directive: {llm_response.output!r}{bcolors.ENDC}"
                 )
             return llm_response.output
         else:
@@ -258,11 +293,10 @@ def summarize_directive_for_user(
             "REPLACE_REMAINDER_OF_PLAN",
         ]:
             summary_parts.append("  - New Steps Proposed:")
-            for i, step_def in enumerate(directive.new_steps_definition):
-                desc = step_def.get("description", "N/A")
-                tool_name = step_def.get("tool_name")
-                tool_params = step_def.get("tool_params")
-                step_summary = f"    {i + 1}. Description: '{desc}'"
+            for i, new_step in enumerate(directive.new_steps_definition):
+                tool_name = new_step.tool_name
+                tool_params = new_step.tool_params
+                step_summary = f"    {i + 1}. Description: '{new_step.description}'"
                 if tool_name:
                     step_summary += f" (Tool: {tool_name}, Params: {json.dumps(tool_params) if tool_params else '{}'})"
                 summary_parts.append(step_summary)
@@ -277,7 +311,7 @@ def summarize_directive_for_user(
                 f"    - '{name}': {belief_data.get('value', 'N/A')}"
             )
 
-    return "\\n".join(summary_parts)
+    return "\n".join(summary_parts)
 
 
 async def handle_user_abort_request(agent: "BDI", intention: "Intention") -> None:
@@ -351,11 +385,16 @@ async def apply_user_guided_action(
             agent, directive.beliefs_to_update
         )
 
-    # THEN: Apply plan manipulation
-    try:
-        async def _handle_retry_current_as_is() -> bool:
-            return True
+    # THEN: Apply plan manipulation. The no-op directives need no handler table.
+    if manip_type == "RETRY_CURRENT_AS_IS":
+        return (True, beliefs_updated)
+    if manip_type == "COMMENT_NO_ACTION":
+        print(
+            f"{bcolors.SYSTEM}  User comment received, no direct action on plan. Reconsidering.{bcolors.ENDC}"
+        )
+        return (False, beliefs_updated)
 
+    try:
         async def _handle_modify_current_and_retry() -> bool:
             if directive.current_step_modifications:
                 plan.modify_current_step(directive.current_step_modifications)
@@ -378,10 +417,8 @@ async def apply_user_guided_action(
                 )
                 return False
 
-            new_steps_list = [
-                PlanStep(**step_def)
-                for step_def in directive.new_steps_definition
-            ]
+            # Already validated as PlanStep objects when the directive was parsed.
+            new_steps_list = directive.new_steps_definition
 
             if manip_type == "REPLACE_CURRENT_STEP_WITH_NEW":
                 plan.replace_current_step(new_steps_list)
@@ -432,12 +469,6 @@ async def apply_user_guided_action(
                 )
             return True
 
-        async def _handle_comment_no_action() -> bool:
-            print(
-                f"{bcolors.SYSTEM}  User comment received, no direct action on plan. Reconsidering.{bcolors.ENDC}"
-            )
-            return False
-
         async def _handle_unknown() -> bool:
             print(
                 f"{bcolors.WARNING}  Unknown or unhandled manipulation_type: {manip_type}. Reconsidering.{bcolors.ENDC}"
@@ -445,7 +476,6 @@ async def apply_user_guided_action(
             return False
 
         handlers = {
-            "RETRY_CURRENT_AS_IS": _handle_retry_current_as_is,
             "MODIFY_CURRENT_AND_RETRY": _handle_modify_current_and_retry,
             "REPLACE_CURRENT_STEP_WITH_NEW": _handle_step_list_manipulation,
             "INSERT_NEW_STEPS_BEFORE_CURRENT": _handle_step_list_manipulation,
@@ -454,7 +484,6 @@ async def apply_user_guided_action(
             "SKIP_CURRENT_STEP": _handle_skip_current_step,
             "ABORT_INTENTION": _handle_abort_intention,
             "UPDATE_BELIEFS_AND_RETRY": _handle_update_beliefs_and_retry,
-            "COMMENT_NO_ACTION": _handle_comment_no_action,
         }
 
         applied_successfully = await handlers.get(manip_type, _handle_unknown)()
@@ -497,92 +526,101 @@ async def human_in_the_loop_intervention(
             f"{bcolors.SYSTEM}Starting human-in-the-loop intervention...{bcolors.ENDC}"
         )
 
-    # 1. Build failure context
+    # 1. Build failure context (unchanged across declined interpretations)
     failure_context = build_failure_context(
         agent, intention, failed_step, step_result
     )
 
-    # 2. Present context to user
-    present_context_to_user(failure_context)
+    while True:
+        # 2. Present context to user
+        present_context_to_user(failure_context)
 
-    # 3. Get user guidance
-    print(
-        f"\n{bcolors.SYSTEM}Please provide guidance on how to proceed (or 'quit' to exit HITL):{bcolors.ENDC}"
-    )
-    try:
-        user_input = input("> ").strip()
-    except (EOFError, KeyboardInterrupt):
+        # 3. Get user guidance
         print(
-            f"\n{bcolors.WARNING}HITL interaction interrupted. Continuing without user guidance.{bcolors.ENDC}"
+            f"\n{bcolors.SYSTEM}Please provide guidance on how to proceed (or 'quit' to exit HITL):{bcolors.ENDC}"
         )
-        return (False, False)
+        try:
+            user_input = input("> ").strip()
+        except (EOFError, KeyboardInterrupt):
+            print(
+                f"\n{bcolors.WARNING}HITL interaction interrupted. Continuing without user guidance.{bcolors.ENDC}"
+            )
+            return (False, False)
 
-    if is_exit_command(user_input):
-        print(
-            f"{bcolors.SYSTEM}User chose to exit HITL. Continuing without guidance.{bcolors.ENDC}"
-        )
-        return (False, False)
+        if is_exit_command(user_input):
+            print(
+                f"{bcolors.SYSTEM}User chose to exit HITL. Continuing without guidance.{bcolors.ENDC}"
+            )
+            return (False, False)
 
-    if not user_input:
-        print(
-            f"{bcolors.WARNING}No guidance provided. Continuing without changes.{bcolors.ENDC}"
-        )
-        return (False, False)
+        if not user_input:
+            print(
+                f"{bcolors.WARNING}No guidance provided. Continuing without changes.{bcolors.ENDC}"
+            )
+            return (False, False)
 
-    # 4. Interpret user guidance via LLM
-    directive = await interpret_user_nl_guidance(agent, user_input, failure_context)
+        # Canonical commands need neither interpretation nor confirmation
+        directive = _fast_directive_from_input(user_input)
+        if directive is not None:
+            print(
+                f"{bcolors.SYSTEM}Applying '{directive.manipulation_type}' directly.{bcolors.ENDC}"
+            )
+            break
 
-    if not directive:
-        print(
-            f"{bcolors.FAIL}Failed to interpret user guidance. Continuing without changes.{bcolors.ENDC}"
-        )
-        return (False, False)
+        # 4. Interpret user guidance via LLM
+        directive = await interpret_user_nl_guidance(agent, user_input, failure_context)
 
-    # 5. Present interpretation back to user for confirmation
-    summary = summarize_directive_for_user(directive)
-    print(f"\n{bcolors.SYSTEM}LLM Interpretation of your guidance:{bcolors.ENDC}")
-    print(summary)
+        if not directive:
+            print(
+                f"{bcolors.FAIL}Failed to interpret user guidance. Continuing without changes.{bcolors.ENDC}"
+            )
+            return (False, False)
 
-    print(f"\n{bcolors.SYSTEM}Apply this guidance? (y/n/edit):{bcolors.ENDC}")
-    try:
-        confirmation = input("> ").strip().lower()
-    except (EOFError, KeyboardInterrupt):
-        print(
-            f"\n{bcolors.WARNING}Confirmation interrupted. Not applying guidance.{bcolors.ENDC}"
-        )
-        return (False, False)
+        # 5. Present interpretation back to user for confirmation
+        summary = summarize_directive_for_user(directive)
+        print(f"\n{bcolors.SYSTEM}LLM Interpretation of your guidance:{bcolors.ENDC}")
+        print(summary)
 
-    if confirmation in ["n", "no"]:
-        print(
-            f"{bcolors.SYSTEM}User declined to apply guidance. Trying again...{bcolors.ENDC}"
-        )
-        return await human_in_the_loop_intervention(
-            agent, intention, failed_step, step_result
-        )
-    elif confirmation in ["edit", "e"]:
-        print(f"{bcolors.SYSTEM}Please provide revised guidance:{bcolors.ENDC}")
+        print(f"\n{bcolors.SYSTEM}Apply this guidance? (y/n/edit):{bcolors.ENDC}")
         try:
-            revised_input = input("> ").strip()
-            if revised_input:
-                revised_directive = await interpret_user_nl_guidance(
-                    agent, revised_input, failure_context
-                )
-                if revised_directive:
-                    directive = revised_directive
+            confirmation = input("> ").strip().lower()
+        except (EOFError, KeyboardInterrupt):
+            print(
+                f"\n{bcolors.WARNING}Confirmation interrupted. Not applying guidance.{bcolors.ENDC}"
+            )
+            return (False, False)
+
+        if confirmation in ["n", "no"]:
+            print(
+                f"{bcolors.SYSTEM}User declined to apply guidance. Trying again...{bcolors.ENDC}"
+            )
+            continue
+
+        if confirmation in ["edit", "e"]:
+            print(f"{bcolors.SYSTEM}Please provide revised guidance:{bcolors.ENDC}")
+            try:
+                revised_input = input("> ").strip()
+                if revised_input:
+                    revised_directive = await interpret_user_nl_guidance(
+                        agent, revised_input, failure_context
+                    )
+                    if revised_directive:
+                        directive = revised_directive
+                    else:
+                        print(
+                            f"{bcolors.FAIL}Failed to interpret revised guidance. Using original.{bcolors.ENDC}"
+                        )
                 else:
                     print(
-                        f"{bcolors.FAIL}Failed to interpret revised guidance. Using original.{bcolors.ENDC}"
+                        f"{bcolors.WARNING}No revised guidance provided. Using original.{bcolors.ENDC}"
                     )
-            else:
+            except (EOFError, KeyboardInterrupt):
                 print(
-                    f"{bcolors.WARNING}No revised guidance provided. Using original.{bcolors.ENDC}"
+                    f"\n{bcolors.WARNING}Edit interrupted. Using original guidance.{bcolors.ENDC}"
                 )
-        except (EOFError, KeyboardInterrupt):
-            print(
-                f"\n{bcolors.WARNING}Edit interrupted. Using original guidance.{bcolors.ENDC}"
-            )
-    elif confirmation not in ["y", "yes"]:
-        print(f"{bcolors.WARNING}Invalid response. Assuming 'yes'.{bcolors.ENDC}")
+        elif confirmation not in ["y", "yes"]:
+            print(f"{bcolors.WARNING}Invalid response. Assuming 'yes'.{bcolors.ENDC}")
+        break
 
     # 6. Apply the guidance
     applied_successfully, beliefs_updated = await apply_user_guided_action(
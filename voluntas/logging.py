@@ -9,10 +9,12 @@ This module provides functions for:
 from collections.abc import Sequence
 from datetime import datetime
 from dataclasses import asdict, is_dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Literal, Optional
 import atexit
 import json
 import os
+import queue
 import re
 import sys
 import threading
@@ -36,21 +38,92 @@ if TYPE_CHECKING:
 _ANSI_ESCAPE_RE = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
 
 
+class _MirrorFileWriter:
+    """Append mirrored output to the log file from a dedicated thread.
+
+    Terminal writes only enqueue text; the writer thread drains whatever has
+    accumulated and appends it with a single write, so file I/O never runs on
+    the caller's (event loop) thread. A single queue keeps stdout and stderr
+    output in order.
+    """
+
+    def __init__(self, log_file):
+        self._log_file = log_file
+        self._queue: queue.Queue[Optional[str]] = queue.Queue()
+        # Guards `closed` so nothing is enqueued behind the shutdown sentinel.
+        self._lock = threading.Lock()
+        self.closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="voluntas-log-mirror", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, data: str) -> None:
+        with self._lock:
+            if not self.closed:
+                self._queue.put(data)
+
+    def flush(self) -> None:
+        """Block until all queued output has been written to the file.
+
+        Returns immediately once closed; the writer thread has already drained
+        everything queued before shutdown.
+        """
+        if not self.closed:
+            self._queue.join()
+
+    def close(self) -> None:
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            self._queue.put(None)
+        self._thread.join()
+        self._log_file.close()
+
+    def _run(self) -> None:
+        pending = self._queue
+        while True:
+            chunks = [pending.get()]
+            while True:
+                try:
+                    chunks.append(pending.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._log_file.write("".join([c for c in chunks if c is not None]))
+                # Let the file buffer absorb bursts; flush once output goes idle.
+                if pending.empty():
+                    self._log_file.flush()
+            except Exception:
+                # Mirroring is best effort; never let a full disk kill the writer.
+                pass
+            finally:
+                for _ in chunks:
+                    pending.task_done()
+
+            if chunks[-1] is None:
+                return
+
+
 class _TerminalMirrorStream:
-    """Mirror a terminal stream to a file handle."""
+    """Mirror a terminal stream to a log file writer.
+
+    Streams that outlive their mirror (e.g. captured by a logging handler)
+    fall back to writing to the terminal only.
+    """
 
     def __init__(
         self,
         terminal_stream,
-        log_file,
+        writer: _MirrorFileWriter,
         *,
         strip_ansi: bool,
-        write_lock: threading.Lock,
     ):
         self._terminal_stream = terminal_stream
-        self._log_file = log_file
+        self._writer = writer
         self._strip_ansi = strip_ansi
-        self._write_lock = write_lock
 
     def write(self, data: str) -> int:
         if not isinstance(data, str):
@@ -59,17 +132,15 @@ class _TerminalMirrorStream:
         written = self._terminal_stream.write(data)
 
         if data:
-            log_data = _ANSI_ESCAPE_RE.sub("", data) if self._strip_ansi else data
-            with self._write_lock:
-                self._log_file.write(log_data)
-                self._log_file.flush()
+            self._writer.write(
+                _ANSI_ESCAPE_RE.sub("", data) if self._strip_ansi else data
+            )
 
         return written
 
     def flush(self) -> None:
         self._terminal_stream.flush()
-        with self._write_lock:
-            self._log_file.flush()
+        self._writer.flush()
 
     def isatty(self) -> bool:
         return self._terminal_stream.isatty()
@@ -88,12 +159,12 @@ class _TerminalMirrorState:
         self,
         *,
         log_file_path: str,
-        log_file,
+        writer: _MirrorFileWriter,
         original_stdout,
         original_stderr,
     ):
         self.log_file_path = log_file_path
-        self.log_file = log_file
+        self.writer = writer
         self.original_stdout = original_stdout
         self.original_stderr = original_stderr
 
@@ -129,28 +200,27 @@ def configure_terminal_output_mirror(
         if _terminal_mirror_state:
             disable_terminal_output_mirror()
 
-        log_file = open(normalized_path, "a", encoding="utf-8")
-        write_lock = threading.Lock()
+        writer = _MirrorFileWriter(
+            open(normalized_path, "a", encoding="utf-8", buffering=1 << 16)
+        )
 
         original_stdout = sys.stdout
         original_stderr = sys.stderr
 
         sys.stdout = _TerminalMirrorStream(
             original_stdout,
-            log_file,
+            writer,
             strip_ansi=strip_ansi,
-            write_lock=write_lock,
         )
         sys.stderr = _TerminalMirrorStream(
             original_stderr,
-            log_file,
+            writer,
             strip_ansi=strip_ansi,
-            write_lock=write_lock,
         )
 
         _terminal_mirror_state = _TerminalMirrorState(
             log_file_path=normalized_path,
-            log_file=log_file,
+            writer=writer,
             original_stdout=original_stdout,
             original_stderr=original_stderr,
         )
@@ -170,10 +240,7 @@ def disable_terminal_output_mirror() -> None:
         sys.stdout = state.original_stdout
         sys.stderr = state.original_stderr
 
-        try:
-            state.log_file.flush()
-        finally:
-            state.log_file.close()
+        state.writer.close()
 
 
 atexit.register(disable_terminal_output_mirror)
@@ -349,15 +416,16 @@ def format_beliefs_for_context(agent: "BDI") -> str:
     Returns:
         Formatted string containing all beliefs with their values and certainty
     """
-    if not agent.beliefs.beliefs:
-        return "No beliefs recorded yet."
+    return agent.beliefs.render(
+        "- {name}: {value} (Certainty: {certainty:.2f})",
+        "No beliefs recorded yet.",
+    )
 
-    beliefs_lines = []
-    for name, belief in agent.beliefs.beliefs.items():
-        beliefs_lines.append(
-            f"- {name}: {belief.value} (Certainty: {belief.certainty:.2f})"
-        )
-    return "\n".join(beliefs_lines)
+
+@lru_cache(maxsize=1024)
+def format_timestamp_iso(timestamp: float) -> str:
+    """Format a belief or history timestamp once; it stays fixed until updated."""
+    return datetime.fromtimestamp(timestamp).isoformat()
 
 
 def log_states(
@@ -376,17 +444,30 @@ def log_states(
         print(f"{bcolors.SYSTEM}{message}{bcolors.ENDC}")
 
     if "beliefs" in types:
-        if agent.verbose:
+        beliefs = agent.beliefs
+        logged = agent._beliefs_logged_at
+        if (
+            agent.verbose
+            and logged is not None
+            and logged[0] is beliefs
+            and logged[1] == beliefs.version
+        ):
+            # The full listing was already printed for this belief version.
+            print(
+                f"{bcolors.BELIEF}Beliefs: {len(beliefs.beliefs)} items (unchanged since last listing){bcolors.ENDC}"
+            )
+        elif agent.verbose:
+            agent._beliefs_logged_at = (beliefs, beliefs.version)
             belief_str = "\n".join(
                 [
-                    f"  - {name}: {b.value} (Source: {b.source}, Certainty: {b.certainty:.2f}, Time: {datetime.fromtimestamp(b.timestamp).isoformat()})"
-                    for name, b in agent.beliefs.beliefs.items()
+                    f"  - {name}: {b.value} (Source: {b.source}, Certainty: {b.certainty:.2f}, Time: {format_timestamp_iso(b.timestamp)})"
+                    for name, b in beliefs.beliefs.items()
                 ]
             )
             print(f"{bcolors.BELIEF}Beliefs:\n{belief_str or '  (None)'}{bcolors.ENDC}")
         else:
             print(
-                f"{bcolors.BELIEF}Beliefs: {len(agent.beliefs.beliefs)} items{bcolors.ENDC}"
+                f"{bcolors.BELIEF}Beliefs: {len(beliefs.beliefs)} items{bcolors.ENDC}"
             )
 
     if "desires" in types:
@@ -452,5 +533,6 @@ __all__ = [
     "configure_terminal_output_mirror",
     "disable_terminal_output_mirror",
     "format_beliefs_for_context",
+    "format_timestamp_iso",
     "log_states",
 ]
@@ -6,17 +6,30 @@ based on updated beliefs and step execution history.
 
 import traceback
 from typing import TYPE_CHECKING
-from datetime import datetime
 from voluntas._utils import bcolors
 from voluntas.schemas import PlanStep, ReconsiderResult
-from voluntas.prompts import build_reconsideration_prompt
-from voluntas.logging import log_states
+from voluntas.prompts import (
+    RECONSIDERATION_INSTRUCTIONS,
+    build_reconsideration_prompt,
+)
+from voluntas.logging import format_timestamp_iso, log_states
 from voluntas.state_transitions import fail_desire_for_intention, replan_desire_for_intention
 
 if TYPE_CHECKING:
     from voluntas.agent import BDI
     from voluntas.schemas import Intention
 
+# Step results are raw tool/model output; history prompts only need the gist.
+MAX_HISTORY_RESULT_CHARS = 500
+
+
+def _clip_result(result: str) -> str:
+    """Shorten a recorded step result so history prompts stay bounded."""
+    if len(result) <= MAX_HISTORY_RESULT_CHARS:
+        return result
+    omitted = len(result) - MAX_HISTORY_RESULT_CHARS
+    return f"{result[:MAX_HISTORY_RESULT_CHARS]}... [{omitted} chars omitted]"
+
 
 def generate_history_context(
     intention: "Intention", max_history: int = 3, include_details: bool = False
@@ -35,6 +48,11 @@ def generate_history_context(
     if not plan.step_history:
         return "No previous steps executed."
 
+    cache_key = (len(plan.step_history), max_history, include_details)
+    cached = plan._history_context_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     recent_history = plan.step_history[-max_history:]
 
     history_lines = []
@@ -43,8 +61,8 @@ def generate_history_context(
 
         if include_details:
             details = [
-                f"  Result: {h.result}",
-                f"  Timestamp: {datetime.fromtimestamp(h.timestamp).isoformat()}",
+                f"  Result: {_clip_result(h.result)}",
+                f"  Timestamp: {format_timestamp_iso(h.timestamp)}",
                 "  Beliefs Updated:",
             ]
 
@@ -57,7 +75,9 @@ def generate_history_context(
 
         history_lines.append(step_info)
 
-    return "\n".join(history_lines)
+    history_context = "\n".join(history_lines)
+    plan._history_context_cache[cache_key] = history_context
+    return history_context
 
 
 def _format_steps(steps) -> str:
@@ -66,30 +86,26 @@ def _format_steps(steps) -> str:
     return "\n".join([f"  - {step.description}" for step in steps])
 
 
-def _format_completed_steps(intention: "Intention") -> str:
-    completed = [h for h in intention.active_plan.step_history if h.success]
-    if not completed:
-        return "  No completed Plan Steps."
+def _format_step_outcomes(intention: "Intention") -> tuple[str, str]:
+    """Split Plan Step History into completed and failed lines in one pass."""
+    completed_lines = []
+    failure_lines = []
+    for h in intention.active_plan.step_history:
+        line = f"  - Plan Step {h.step_number + 1}: {h.step_description} -> {_clip_result(h.result)}"
+        if h.success:
+            completed_lines.append(line)
+        else:
+            failure_lines.append(line)
 
-    return "\n".join(
-        [
-            f"  - Plan Step {h.step_number + 1}: {h.step_description} -> {h.result}"
-            for h in completed
-        ]
+    completed_text = (
+        "\n".join(completed_lines) if completed_lines else "  No completed Plan Steps."
     )
-
-
-def _format_failure_history(intention: "Intention") -> str:
-    failures = [h for h in intention.active_plan.step_history if not h.success]
-    if not failures:
-        return "  No relevant failures recorded."
-
-    return "\n".join(
-        [
-            f"  - Plan Step {h.step_number + 1}: {h.step_description} -> {h.result}"
-            for h in failures
-        ]
+    failure_text = (
+        "\n".join(failure_lines)
+        if failure_lines
+        else "  No relevant failures recorded."
     )
+    return completed_text, failure_text
 
 
 def _apply_plan_repair(
@@ -144,20 +160,13 @@ async def reconsider_current_intention(agent: "BDI") -> None:
         f"{bcolors.SYSTEM}  Reconsidering intention for desire '{intention.desire_id}'...{bcolors.ENDC}"
     )
 
-    beliefs_text = (
-        "\n".join(
-            [
-                f"  - {name}: {b.value} (Certainty: {b.certainty:.2f})"
-                for name, b in agent.beliefs.beliefs.items()
-            ]
-        )
-        if agent.beliefs.beliefs
-        else "  No current beliefs."
+    beliefs_text = agent.beliefs.render(
+        "  - {name}: {value} (Certainty: {certainty:.2f})",
+        "  No current beliefs.",
     )
 
     remaining_steps_text = _format_steps(plan.steps[plan.current_step_index :])
-    completed_steps_text = _format_completed_steps(intention)
-    failure_history_text = _format_failure_history(intention)
+    completed_steps_text, failure_history_text = _format_step_outcomes(intention)
 
     reconsider_prompt = build_reconsideration_prompt(
         beliefs_text,
@@ -173,7 +182,9 @@ async def reconsider_current_intention(agent: "BDI") -> None:
                 f"{bcolors.SYSTEM}  Asking LLM to assess plan validity...{bcolors.ENDC}"
             )
         reconsider_result = await agent.run(
-            reconsider_prompt, output_type=ReconsiderResult
+            reconsider_prompt,
+            output_type=ReconsiderResult,
+            instructions=RECONSIDERATION_INSTRUCTIONS,
         )
 
         if not reconsider_result or not reconsider_result.output:
@@ -16,7 +16,7 @@ from voluntas.schemas import (
     PlanStep,
 )
 from voluntas.logging import log_states
-from voluntas.prompts import build_planning_stage1_prompt
+from voluntas.prompts import PLANNING_INSTRUCTIONS, build_planning_stage1_prompt
 from voluntas.state_transitions import update_desire_status
 
 if TYPE_CHECKING:
@@ -52,8 +52,14 @@ async def generate_intentions_from_desires(agent: "BDI") -> None:
         )
         return
 
-    pending_desires = [d for d in agent.desires if d.status is DesireStatus.PENDING]
-    if not pending_desires:
+    # Collect pending desires and their prompt lines in a single sweep.
+    pending_by_id = {}
+    desire_lines = []
+    for d in agent.desires:
+        if d.status is DesireStatus.PENDING:
+            pending_by_id[d.id] = d
+            desire_lines.append(f"- ID: {d.id}, Description: {d.description}")
+    if not pending_by_id:
         print(f"{bcolors.SYSTEM}No pending desires to plan for.{bcolors.ENDC}")
         return
 
@@ -63,18 +69,10 @@ async def generate_intentions_from_desires(agent: "BDI") -> None:
         )
 
     # --- Context Gathering ---
-    desires_text = "\n".join(
-        [f"- ID: {d.id}, Description: {d.description}" for d in pending_desires]
-    )
-    beliefs_text = (
-        "\n".join(
-            [
-                f"- {name}: {belief.value} (Source: {belief.source}, Certainty: {belief.certainty:.2f})"
-                for name, belief in agent.beliefs.beliefs.items()
-            ]
-        )
-        if agent.beliefs.beliefs
-        else "No current beliefs."
+    desires_text = "\n".join(desire_lines)
+    beliefs_text = agent.beliefs.render(
+        "- {name}: {value} (Source: {source}, Certainty: {certainty:.2f})",
+        "No current beliefs.",
     )
 
     use_explicit_intentions = bool(agent.initial_intention_guidance) and not getattr(
@@ -89,7 +87,7 @@ async def generate_intentions_from_desires(agent: "BDI") -> None:
             f"{bcolors.SYSTEM}Using first explicit intention provided by user (skipping planning LLM).{bcolors.ENDC}"
         )
         decision = PlanningDecision(
-            desire_id=pending_desires[0].id,
+            desire_id=next(iter(pending_by_id)),
             description=agent.initial_intention_guidance[0],
         )
         if agent.verbose:
@@ -112,7 +110,9 @@ async def generate_intentions_from_desires(agent: "BDI") -> None:
         )
         try:
             stage1_result = await agent.run(
-                prompt_stage1, output_type=PlanningDecision
+                prompt_stage1,
+                output_type=PlanningDecision,
+                instructions=PLANNING_INSTRUCTIONS,
             )
             if not stage1_result or not stage1_result.output:
                 print(
@@ -127,7 +127,7 @@ async def generate_intentions_from_desires(agent: "BDI") -> None:
             )
             return
 
-    if decision.desire_id not in {desire.id for desire in pending_desires}:
+    if decision.desire_id not in pending_by_id:
         print(
             f"{bcolors.FAIL}Planning decision targeted a Desire that is not pending.{bcolors.ENDC}"
         )
@@ -7,89 +7,184 @@ from typing import Any
 import json
 from textwrap import dedent
 
+from pydantic_core import to_json
+
+
+_INITIAL_BELIEF_EXTRACTION_PROMPT_TEMPLATE = "Desire Descriptions:\n{desires_text}"
+
 
 def build_initial_belief_extraction_prompt(desires_text: str) -> str:
-    return dedent(
-        f"""
-        Analyze the following desire descriptions and extract any factual information that should be recorded as beliefs.
-
-        Desire Descriptions:
-        {desires_text}
-
-        Extract ONLY concrete, factual information explicitly stated in the desires, such as:
-        - File paths or directory paths (e.g., "repository path is /path/to/repo")
-        - Names or identifiers (e.g., "the project is called X")
-        - URLs or endpoints
-        - Specific values or configurations mentioned
-        - Any other concrete facts that would be useful context
-
-        Do NOT extract:
-        - The goals or objectives themselves (these are desires, not beliefs)
-        - Inferred or assumed information not explicitly stated
-        - Vague or subjective statements
-
-        IMPORTANT: Each belief MUST have exactly these three fields:
-        - "name": A concise identifier string (e.g., "repo_path", "project_name", "target_url")
-        - "value": The actual value as a string (e.g., "/path/to/repo", "my-project", "https://api.example.com")
-        - "certainty": A float between 0.0 and 1.0 (use 1.0 for explicitly stated facts)
-
-        Example of CORRECT format:
-        {{
-          "beliefs": [
-            {{"name": "repo_path", "value": "/Users/douglas/code/masters/pydantic-ai-voluntas", "certainty": 1.0}},
-            {{"name": "repo_name", "value": "pydantic-ai-voluntas", "certainty": 1.0}}
-          ],
-          "explanation": "Extracted repository path and name from desire description."
-        }}
-
-        Example of INCORRECT format (DO NOT USE):
-        {{
-          "beliefs": [{{"repo_path": "/path", "repo_name": "project"}}]
-        }}
-
-        If no factual information can be extracted, return an empty beliefs list with an explanation.
-        """
+    return _INITIAL_BELIEF_EXTRACTION_PROMPT_TEMPLATE.format_map(
+        {"desires_text": desires_text}
     )
 
 
+# Static instruction blocks are passed separately from the per-call context so
+# providers can reuse the cached prompt prefix across BDI cycles.
+PLANNING_INSTRUCTIONS = dedent(
+    """
+    Given the pending desires and current beliefs, select exactly one desire to pursue now and identify exactly one high-level intention for it.
+    The intention should represent a distinct goal or task achievable *by you, the AI agent*.
+
+    Focus ONLY on WHAT needs to be done at a high level, but ensure these goals are achievable through information processing, analysis, or using the available tools.
+    Do *not* propose intentions that you do not possess the hability to do.
+
+    Available Tools:
+    (The underlying Pydantic AI agent will provide the available tools, including those from MCP, to the LLM.)
+
+    Respond with exactly one high-level intention using the required format. Associate it with the selected desire ID.
+    Do not propose intentions for unselected desires.
+    """
+).strip()
+
+INITIAL_BELIEF_EXTRACTION_INSTRUCTIONS = dedent(
+    """
+    Analyze the provided desire descriptions and extract any factual information that should be recorded as beliefs.
+
+    Extract ONLY concrete, factual information explicitly stated in the desires, such as:
+    - File paths or directory paths (e.g., "repository path is /path/to/repo")
+    - Names or identifiers (e.g., "the project is called X")
+    - URLs or endpoints
+    - Specific values or configurations mentioned
+    - Any other concrete facts that would be useful context
+
+    Do NOT extract:
+    - The goals or objectives themselves (these are desires, not beliefs)
+    - Inferred or assumed information not explicitly stated
+    - Vague or subjective statements
+
+    IMPORTANT: Each belief MUST have exactly these three fields:
+    - "name": A concise identifier string (e.g., "repo_path", "project_name", "target_url")
+    - "value": The actual value as a string (e.g., "/path/to/repo", "my-project", "https://api.example.com")
+    - "certainty": A float between 0.0 and 1.0 (use 1.0 for explicitly stated facts)
+
+    Example of CORRECT format:
+    {
+      "beliefs": [
+        {"name": "repo_path", "value": "/Users/douglas/code/masters/pydantic-ai-voluntas", "certainty": 1.0},
+        {"name": "repo_name", "value": "pydantic-ai-voluntas", "certainty": 1.0}
+      ],
+      "explanation": "Extracted repository path and name from desire description."
+    }
+
+    Example of INCORRECT format (DO NOT USE):
+    {
+      "beliefs": [{"repo_path": "/path", "repo_name": "project"}]
+    }
+
+    If no factual information can be extracted, return an empty beliefs list with an explanation.
+    """
+).strip()
+
+
+# Per-call prompt skeletons are dedented once at import and filled with
+# `format_map`, so only the dynamic values are copied on each call.
+_PLANNING_PROMPT_TEMPLATE = dedent(
+    """
+    Pending Desires:
+    {desires_text}
+
+    Current Beliefs:
+    {beliefs_text}
+
+    {guidance_section}
+    """
+)
+
+_PLANNING_GUIDANCE_TEMPLATE = dedent(
+    """
+    Initial Intention Guidance:
+    {intention_guidance_text}
+
+    Treat this as contextual guidance from the original user-provided workflow, not as a mandatory queue to recreate.
+    """
+)
+
+
 def build_planning_stage1_prompt(
     desires_text: str,
     beliefs_text: str,
     intention_guidance_text: str | None = None,
 ) -> str:
     guidance_section = (
-        f"""
-        Initial Intention Guidance:
-        {intention_guidance_text}
-
-        Treat this as contextual guidance from the original user-provided workflow, not as a mandatory queue to recreate.
-        """
+        _PLANNING_GUIDANCE_TEMPLATE.format_map(
+            {"intention_guidance_text": intention_guidance_text}
+        )
         if intention_guidance_text
         else ""
     )
-    return dedent(
-        f"""
-        Given the following pending desires and current beliefs, select exactly one desire to pursue now and identify exactly one high-level intention for it.
-        The intention should represent a distinct goal or task achievable *by you, the AI agent*.
+    return _PLANNING_PROMPT_TEMPLATE.format_map(
+        {
+            "desires_text": desires_text,
+            "beliefs_text": beliefs_text,
+            "guidance_section": guidance_section,
+        }
+    )
 
-        Focus ONLY on WHAT needs to be done at a high level, but ensure these goals are achievable through information processing, analysis, or using the available tools.
-        Do *not* propose intentions that you do not possess the hability to do.
 
-        Pending Desires:
-        {desires_text}
+# Belief extraction rules shared by the standalone extraction and the combined
+# step analysis, so both ask the model for the same belief shape.
+_STEP_BELIEF_EXTRACTION_RULES = dedent(
+    """
+    Extract beliefs about:
+    - Factual information discovered (e.g., file paths, status values, API responses)
+    - Error causes or constraints (e.g., "path does not exist", "network unavailable")
+    - State changes or conditions revealed (e.g., "repository is empty", "file contains X")
+    - Tool availability or limitations learned (e.g., "tool requires parameter Y")
+
+    For FAILED steps, focus on extracting information about WHY it failed - these constraints are valuable.
+    For SUCCESSFUL steps, extract the positive information discovered.
+
+    CRITICAL DEDUPLICATION RULES:
+    - Do NOT re-emit facts that are already present in Current Known Beliefs unless the value changed.
+    - Do NOT emit synonyms for existing belief names (reuse the same belief name when possible).
+    - If the step only repeats existing beliefs, return an empty beliefs list.
+    - Avoid operational/meta beliefs like step_success unless they represent genuinely new state.
+
+    IMPORTANT: Each belief MUST have exactly these three fields:
+    - "name": A concise identifier string (e.g., "repo_path", "commit_count", "error_type")
+    - "value": The actual value as a string (e.g., "/path/to/repo", "42", "permission_denied")
+    - "certainty": A float between 0.0 and 1.0 indicating confidence
+    """
+).strip()
+
+STEP_BELIEF_EXTRACTION_INSTRUCTIONS = "\n\n".join(
+    (
+        "Analyze the step execution and extract any factual information that should be recorded as beliefs.",
+        _STEP_BELIEF_EXTRACTION_RULES,
+        dedent(
+            """
+            Example of CORRECT format:
+            {
+              "beliefs": [
+                {"name": "repo_path", "value": "/Users/douglas/code/project", "certainty": 1.0},
+                {"name": "has_commits", "value": "true", "certainty": 0.9}
+              ],
+              "explanation": "Extracted repository path and confirmed commits exist."
+            }
+
+            Example of INCORRECT format (DO NOT USE):
+            {
+              "beliefs": [{"repo_path": "/path", "has_commits": true}]
+            }
+
+            If no meaningful beliefs can be extracted, return an empty beliefs list with an explanation.
+            """
+        ).strip(),
+    )
+)
 
-        Current Beliefs:
-        {beliefs_text}
 
-        {guidance_section}
+_STEP_BELIEF_EXTRACTION_PROMPT_TEMPLATE = dedent(
+    """
+    Step Objective: "{step_description}"
+    Step Result: "{step_result}"
+    Step Success: {step_success}
 
-        Available Tools:
-        (The underlying Pydantic AI agent will provide the available tools, including those from MCP, to the LLM.)
-
-        Respond with exactly one high-level intention using the required format. Associate it with the selected desire ID.
-        Do not propose intentions for unselected desires.
-        """
-    )
+    Current Known Beliefs:
+    {current_beliefs}
+    """
+)
 
 
 def build_step_belief_extraction_prompt(
@@ -98,97 +193,144 @@ def build_step_belief_extraction_prompt(
     step_success: bool,
     current_beliefs: str,
 ) -> str:
-    return dedent(
-        f"""
-        Analyze the following step execution and extract any factual information that should be recorded as beliefs.
-
-        Step Objective: "{step_description}"
-        Step Result: "{step_result}"
-        Step Success: {step_success}
-
-        Current Known Beliefs:
-        {current_beliefs}
-
-        Extract beliefs about:
-        - Factual information discovered (e.g., file paths, status values, API responses)
-        - Error causes or constraints (e.g., "path does not exist", "network unavailable")
-        - State changes or conditions revealed (e.g., "repository is empty", "file contains X")
-        - Tool availability or limitations learned (e.g., "tool requires parameter Y")
-
-        For FAILED steps, focus on extracting information about WHY it failed - these constraints are valuable.
-        For SUCCESSFUL steps, extract the positive information discovered.
-
-        CRITICAL DEDUPLICATION RULES:
-        - Do NOT re-emit facts that are already present in Current Known Beliefs unless the value changed.
-        - Do NOT emit synonyms for existing belief names (reuse the same belief name when possible).
-        - If the step only repeats existing beliefs, return an empty beliefs list.
-        - Avoid operational/meta beliefs like step_success unless they represent genuinely new state.
-
-        IMPORTANT: Each belief MUST have exactly these three fields:
-        - "name": A concise identifier string (e.g., "repo_path", "commit_count", "error_type")
-        - "value": The actual value as a string (e.g., "/path/to/repo", "42", "permission_denied")
-        - "certainty": A float between 0.0 and 1.0 indicating confidence
-
-        Example of CORRECT format:
-        {{
-          "beliefs": [
-            {{"name": "repo_path", "value": "/Users/douglas/code/project", "certainty": 1.0}},
-            {{"name": "has_commits", "value": "true", "certainty": 0.9}}
-          ],
-          "explanation": "Extracted repository path and confirmed commits exist."
-        }}
-
-        Example of INCORRECT format (DO NOT USE):
-        {{
-          "beliefs": [{{"repo_path": "/path", "has_commits": true}}]
-        }}
-
-        If no meaningful beliefs can be extracted, return an empty beliefs list with an explanation.
-        """
+    return _STEP_BELIEF_EXTRACTION_PROMPT_TEMPLATE.format_map(
+        {
+            "step_description": step_description,
+            "step_result": step_result,
+            "step_success": step_success,
+            "current_beliefs": current_beliefs,
+        }
     )
 
 
-def build_step_assessment_prompt(
+_STEP_ASSESSMENT_GUIDELINES = dedent(
+    """
+    Assessment Guidelines:
+
+    FOR TOOL CALL STEPS:
+    - If the tool executed and returned data (not an error message), mark as SUCCESS
+    - The result may include analysis or discussion of the data - this is normal and doesn't indicate failure
+    - Only mark as FAILED if the tool returned an error, exception, or "not found" type message
+
+    FOR CHECK/VERIFY STEPS:
+    - If the result provides a definitive answer (yes/no, found/not found, true/false), mark as SUCCESS
+
+    FOR DESCRIPTIVE STEPS (no tool call):
+    - If the step produced a concrete outcome or information, mark as SUCCESS
+    - If the step only discussed what should be done without doing it, mark as FAILED
+
+    FOR ALL STEPS:
+    - Ignore verbose explanations or analysis in the result - focus on whether the objective was met
+    - If the result explicitly states an error occurred, mark as FAILED
+    - If uncertain, prefer SUCCESS over FAILURE (be lenient)
+    """
+).strip()
+
+STEP_ANALYSIS_INSTRUCTIONS = "\n\n".join(
+    (
+        "Evaluate if the step successfully achieved its original objective, and extract any factual information from its result that should be recorded as beliefs.",
+        _STEP_ASSESSMENT_GUIDELINES,
+        _STEP_BELIEF_EXTRACTION_RULES,
+        dedent(
+            """
+            Provide your analysis as:
+            - success: true if the step achieved its objective, false if it clearly failed
+            - reason: brief explanation (especially important if failed)
+            - beliefs: list of extracted beliefs (empty if nothing new was learned)
+            - explanation: brief explanation of what information was extracted
+
+            Example of CORRECT format:
+            {
+              "success": false,
+              "reason": "The repository path does not exist.",
+              "beliefs": [
+                {"name": "repo_path_exists", "value": "false", "certainty": 1.0}
+              ],
+              "explanation": "Recorded that the configured repository path is missing."
+            }
+
+            Example of INCORRECT format (DO NOT USE):
+            {
+              "success": "yes",
+              "beliefs": [{"repo_path": "/path", "has_commits": true}]
+            }
+            """
+        ).strip(),
+    )
+)
+
+
+_STEP_ANALYSIS_PROMPT_TEMPLATE = dedent(
+    """
+    Original objective for the step: "{step_description}"
+    Step type: {step_type}
+
+    Recent step history:
+    {history_context}
+
+    Result obtained: "{result_output}"
+
+    Current Known Beliefs:
+    {current_beliefs}
+    """
+)
+
+
+def build_step_analysis_prompt(
     step_description: str,
     result_output: str,
     step_type: str,
     history_context: str,
+    current_beliefs: str,
 ) -> str:
-    return dedent(
-        f"""
-        Original objective for the step: "{step_description}"
-        Result obtained: "{result_output}"
-        Step type: {step_type}
+    return _STEP_ANALYSIS_PROMPT_TEMPLATE.format_map(
+        {
+            "step_description": step_description,
+            "step_type": step_type,
+            "history_context": history_context,
+            "result_output": result_output,
+            "current_beliefs": current_beliefs,
+        }
+    )
 
-        Recent step history:
-        {history_context}
 
-        Evaluate if the step successfully achieved its original objective.
+DESIRE_SATISFACTION_INSTRUCTIONS = dedent(
+    """
+    Assess whether the Desire is satisfied after a completed Intention.
+    Decide only whether the Desire itself is now satisfied.
 
-        Assessment Guidelines:
+    Decision rules:
+    1. Return satisfied=true only when the Desire description has been fulfilled by the completed Intention history and current beliefs.
+    2. Return satisfied=false when useful work remains, when the outcome is partial, or when the evidence is unclear.
+    3. Do not mark the Desire satisfied merely because the Intention completed.
+    4. Remaining Intentions are context, not proof that the Desire is unsatisfied.
 
-        FOR TOOL CALL STEPS:
-        - If the tool executed and returned data (not an error message), mark as SUCCESS
-        - The result may include analysis or discussion of the data - this is normal and doesn't indicate failure
-        - Only mark as FAILED if the tool returned an error, exception, or "not found" type message
+    Provide your assessment as:
+    - satisfied: true if the Desire is fulfilled, false otherwise
+    - reason: concise explanation for the lifecycle decision
+    """
+).strip()
 
-        FOR CHECK/VERIFY STEPS:
-        - If the result provides a definitive answer (yes/no, found/not found, true/false), mark as SUCCESS
 
-        FOR DESCRIPTIVE STEPS (no tool call):
-        - If the step produced a concrete outcome or information, mark as SUCCESS
-        - If the step only discussed what should be done without doing it, mark as FAILED
+_DESIRE_SATISFACTION_PROMPT_TEMPLATE = dedent(
+    """
+    Desire:
+    - ID: {desire_id}
+    - Description: {desire_description}
 
-        FOR ALL STEPS:
-        - Ignore verbose explanations or analysis in the result - focus on whether the objective was met
-        - If the result explicitly states an error occurred, mark as FAILED
-        - If uncertain, prefer SUCCESS over FAILURE (be lenient)
+    Completed Intention:
+    {completed_intention_description}
 
-        Provide your assessment:
-        - success: true if the step achieved its objective, false if it clearly failed
-        - reason: brief explanation (especially important if failed)
-        """
-    )
+    Completed Intention History:
+    {completed_intention_history}
+
+    Current Beliefs:
+    {current_beliefs}
+
+    Remaining Intentions for this Desire:
+    {remaining_intentions_text}
+    """
+)
 
 
 def build_desire_satisfaction_prompt(
@@ -199,38 +341,15 @@ def build_desire_satisfaction_prompt(
     current_beliefs: str,
     remaining_intentions_text: str,
 ) -> str:
-    return dedent(
-        f"""
-        Assess whether the Desire is satisfied after a completed Intention.
-
-        Desire:
-        - ID: {desire_id}
-        - Description: {desire_description}
-
-        Completed Intention:
-        {completed_intention_description}
-
-        Completed Intention History:
-        {completed_intention_history}
-
-        Current Beliefs:
-        {current_beliefs}
-
-        Remaining Intentions for this Desire:
-        {remaining_intentions_text}
-
-        Decide only whether the Desire itself is now satisfied.
-
-        Decision rules:
-        1. Return satisfied=true only when the Desire description has been fulfilled by the completed Intention history and current beliefs.
-        2. Return satisfied=false when useful work remains, when the outcome is partial, or when the evidence is unclear.
-        3. Do not mark the Desire satisfied merely because the Intention completed.
-        4. Remaining Intentions are context, not proof that the Desire is unsatisfied.
-
-        Provide your assessment as:
-        - satisfied: true if the Desire is fulfilled, false otherwise
-        - reason: concise explanation for the lifecycle decision
-        """
+    return _DESIRE_SATISFACTION_PROMPT_TEMPLATE.format_map(
+        {
+            "desire_id": desire_id,
+            "desire_description": desire_description,
+            "completed_intention_description": completed_intention_description,
+            "completed_intention_history": completed_intention_history,
+            "current_beliefs": current_beliefs,
+            "remaining_intentions_text": remaining_intentions_text,
+        }
     )
 
 
@@ -286,6 +405,46 @@ def build_descriptive_execution_prompt(
     )
 
 
+RECONSIDERATION_INSTRUCTIONS = dedent(
+    """
+    Evaluate the active Plan as a whole, not whether one Plan Step is sufficient by itself.
+
+    Provide your assessment as:
+    - action: one of "continue", "repair_plan", "replace_plan", or "fail_desire"
+    - reason: brief explanation for the selected action
+    - plan_steps: required for "repair_plan" and "replace_plan"; omit or return null otherwise
+
+    Consider:
+    1. Are the Remaining Plan Steps still likely to achieve the original Desire?
+    2. Did completed Plan Steps make valid progress toward the Desire?
+    3. Do failures, contradictions, stale assumptions, or current Beliefs require repair or replacement?
+    4. Use "continue" only when the existing Plan should keep running as-is.
+    5. Use "repair_plan" when the current Plan is mostly sound but needs local changes.
+    6. Use "replace_plan" when the Plan strategy is no longer suitable and should be replanned.
+    7. Use "fail_desire" only when the Desire should be abandoned as infeasible or invalid.
+    8. For "repair_plan", plan_steps should replace the remaining Plan Steps from the current failed/stale step onward.
+    9. For "replace_plan", plan_steps should be a full replacement Plan for the committed Intention.
+    """
+).strip()
+
+
+_RECONSIDERATION_PROMPT_TEMPLATE = dedent(
+    """
+    Current Agent Beliefs:
+    {beliefs_text}
+
+    Completed Plan Steps:
+    {completed_steps_text}
+
+    Remaining Plan Steps (for Desire ID '{desire_id}'):
+    {remaining_steps_text}
+
+    Relevant Failure History:
+    {failure_history_text}
+    """
+)
+
+
 def build_reconsideration_prompt(
     beliefs_text: str,
     completed_steps_text: str,
@@ -293,95 +452,116 @@ def build_reconsideration_prompt(
     remaining_steps_text: str,
     failure_history_text: str,
 ) -> str:
-    return dedent(
-        f"""
-        Current Agent Beliefs:
-        {beliefs_text}
-
-        Completed Plan Steps:
-        {completed_steps_text}
-
-        Remaining Plan Steps (for Desire ID '{desire_id}'):
-        {remaining_steps_text}
-
-        Relevant Failure History:
-        {failure_history_text}
-
-        Evaluate the active Plan as a whole, not whether one Plan Step is sufficient by itself.
-
-        Provide your assessment as:
-        - action: one of "continue", "repair_plan", "replace_plan", or "fail_desire"
-        - reason: brief explanation for the selected action
-        - plan_steps: required for "repair_plan" and "replace_plan"; omit or return null otherwise
-
-        Consider:
-        1. Does the full Plan remain likely to achieve the original desire '{desire_id}'?
-        2. Did completed Plan Steps make valid progress toward the Desire?
-        3. Do failures, contradictions, stale assumptions, or current Beliefs require repair or replacement?
-        4. Use "continue" only when the existing Plan should keep running as-is.
-        5. Use "repair_plan" when the current Plan is mostly sound but needs local changes.
-        6. Use "replace_plan" when the Plan strategy is no longer suitable and should be replanned.
-        7. Use "fail_desire" only when the Desire should be abandoned as infeasible or invalid.
-        8. For "repair_plan", plan_steps should replace the remaining Plan Steps from the current failed/stale step onward.
-        9. For "replace_plan", plan_steps should be a full replacement Plan for the committed Intention.
-        """
+    return _RECONSIDERATION_PROMPT_TEMPLATE.format_map(
+        {
+            "beliefs_text": beliefs_text,
+            "completed_steps_text": completed_steps_text,
+            "desire_id": desire_id,
+            "remaining_steps_text": remaining_steps_text,
+            "failure_history_text": failure_history_text,
+        }
     )
 
 
+_FAILURE_CONTEXT_JSON_FIELDS = (
+    "original_failed_step_object",
+    "tool_params",
+    "step_result_output",
+    "current_beliefs",
+    "remaining_plan_steps",
+)
+
+
+def serialize_failure_context(failure_context: dict[str, Any]) -> dict[str, str]:
+    """Serialize the JSON-rendered failure context fields once for prompt reuse."""
+    return {
+        field: to_json(failure_context.get(field), fallback=str).decode()
+        for field in _FAILURE_CONTEXT_JSON_FIELDS
+    }
+
+
+_HITL_INTERPRETATION_PROMPT_TEMPLATE = dedent(
+    """
+    The BDI agent encountered a failure during plan execution.
+    The user has provided natural language guidance on how to proceed.
+    Your task is to interpret this guidance and translate it into a structured PlanManipulationDirective.
+
+    Current Failure Context:
+    - Desire ID: {desire_id}
+    - Intention: {intention_description}
+    - Plan Status: {plan_status}
+    - Failed Plan Step ({failed_step_number}/{total_steps_in_plan}): "{failed_step_description}"
+    - Original Failed Plan Step Object: {original_failed_step_object}
+    - Is Tool Call: {is_tool_call}
+    - Tool Name: {tool_name}
+    - Tool Params Used: {tool_params}
+    - Plan Step Result Data: {step_result_output}
+    - Current Beliefs: {current_beliefs}
+    - Remaining Plan Steps (after failed one): {remaining_plan_steps}
+
+    User's Natural Language Guidance:
+    "{user_nl_instruction}"
+
+    {tools_description_for_llm}
+
+    Instructions for you, the LLM:
+    1. Analyze the user's guidance in the context of the failure.
+    2. Determine the most appropriate 'manipulation_type' from the available literals in PlanManipulationDirective.
+
+    CRITICAL: Extract Factual Information to Beliefs
+    3. **ALWAYS populate 'beliefs_to_update' when the user provides factual information**, REGARDLESS of manipulation_type.
+       This is INDEPENDENT of plan modification. You can extract beliefs AND modify the plan in the same directive.
+       Examples of factual information to extract as beliefs:
+       * File paths (e.g., "the repo is at /path/to/repo" -> belief: repo_path = "/path/to/repo")
+       * Status values (e.g., "the service is offline" -> belief: service_status = "offline")
+       * Configuration values (e.g., "use port 8080" -> belief: server_port = "8080")
+       * Constraints (e.g., "that API requires authentication" -> belief: api_requires_auth = "true")
+       * Error causes (e.g., "path doesn't exist" -> belief: path_invalid = "true")
+
+    Plan Manipulation:
+    4. If the user suggests modifying the current step, populate 'current_step_modifications' with a dictionary of changes. For tool calls, this is often a new 'tool_params' dictionary. For descriptive steps, it might be a new 'description'.
+    5. If the user suggests new steps, populate 'new_steps_definition' with a list of Plan Steps conforming to the PlanStep schema (fields: description, is_tool_call, tool_name, tool_params).
+       If generating tool calls, ensure 'tool_name' is valid from the available tools and 'tool_params' are appropriate.
+
+    Summary:
+    6. Provide a concise 'user_guidance_summary' explaining your interpretation, chosen action, AND any beliefs extracted.
+    7. If the user's guidance is unclear, a comment, or cannot be mapped to a specific plan manipulation, use 'COMMENT_NO_ACTION' and explain in the summary (but still extract beliefs if factual information was provided).
+
+    REMEMBER: Belief extraction and plan manipulation are ORTHOGONAL. Even when choosing MODIFY_CURRENT_AND_RETRY or RETRY_CURRENT_AS_IS, if the user provides factual information, EXTRACT IT TO BELIEFS.
+    """
+)
+
+
 def build_hitl_interpretation_prompt(
     failure_context: dict[str, Any],
     user_nl_instruction: str,
     tools_description_for_llm: str,
 ) -> str:
-    return dedent(
-        f"""
-        The BDI agent encountered a failure during plan execution.
-        The user has provided natural language guidance on how to proceed.
-        Your task is to interpret this guidance and translate it into a structured PlanManipulationDirective.
-
-        Current Failure Context:
-        - Desire ID: {failure_context["desire_id"]}
-        - Intention: {failure_context.get("intention_description") or "(no description)"}
-        - Plan Status: {failure_context.get("plan_status", "unknown")}
-        - Failed Plan Step ({failure_context["failed_step_number"]}/{failure_context["total_steps_in_plan"]}): "{failure_context["failed_step_description"]}"
-        - Original Failed Plan Step Object: {json.dumps(failure_context["original_failed_step_object"])}
-        - Is Tool Call: {failure_context["is_tool_call"]}
-        - Tool Name: {failure_context["tool_name"] if failure_context["is_tool_call"] else "N/A"}
-        - Tool Params Used: {json.dumps(failure_context["tool_params"]) if failure_context["is_tool_call"] and failure_context["tool_params"] else "N/A"}
-        - Plan Step Result Data: {json.dumps(failure_context["step_result_output"])}
-        - Current Beliefs: {json.dumps(failure_context["current_beliefs"])}
-        - Remaining Plan Steps (after failed one): {json.dumps(failure_context["remaining_plan_steps"])}
-
-        User's Natural Language Guidance:
-        "{user_nl_instruction}"
-
-        {tools_description_for_llm}
-
-        Instructions for you, the LLM:
-        1. Analyze the user's guidance in the context of the failure.
-        2. Determine the most appropriate 'manipulation_type' from the available literals in PlanManipulationDirective.
-
-        CRITICAL: Extract Factual Information to Beliefs
-        3. **ALWAYS populate 'beliefs_to_update' when the user provides factual information**, REGARDLESS of manipulation_type.
-           This is INDEPENDENT of plan modification. You can extract beliefs AND modify the plan in the same directive.
-           Examples of factual information to extract as beliefs:
-           * File paths (e.g., "the repo is at /path/to/repo" -> belief: repo_path = "/path/to/repo")
-           * Status values (e.g., "the service is offline" -> belief: service_status = "offline")
-           * Configuration values (e.g., "use port 8080" -> belief: server_port = "8080")
-           * Constraints (e.g., "that API requires authentication" -> belief: api_requires_auth = "true")
-           * Error causes (e.g., "path doesn't exist" -> belief: path_invalid = "true")
-
-        Plan Manipulation:
-        4. If the user suggests modifying the current step, populate 'current_step_modifications' with a dictionary of changes. For tool calls, this is often a new 'tool_params' dictionary. For descriptive steps, it might be a new 'description'.
-        5. If the user suggests new steps, populate 'new_steps_definition' with a list of dictionaries. Each dictionary must conform to the PlanStep schema (fields: description, is_tool_call, tool_name, tool_params).
-           If generating tool calls, ensure 'tool_name' is valid from the available tools and 'tool_params' are appropriate.
-
-        Summary:
-        6. Provide a concise 'user_guidance_summary' explaining your interpretation, chosen action, AND any beliefs extracted.
-        7. If the user's guidance is unclear, a comment, or cannot be mapped to a specific plan manipulation, use 'COMMENT_NO_ACTION' and explain in the summary (but still extract beliefs if factual information was provided).
-
-        REMEMBER: Belief extraction and plan manipulation are ORTHOGONAL. Even when choosing MODIFY_CURRENT_AND_RETRY or RETRY_CURRENT_AS_IS, if the user provides factual information, EXTRACT IT TO BELIEFS.
-        """
+    serialized = failure_context.get("serialized") or serialize_failure_context(
+        failure_context
+    )
+    is_tool_call = failure_context["is_tool_call"]
+    return _HITL_INTERPRETATION_PROMPT_TEMPLATE.format_map(
+        {
+            "desire_id": failure_context["desire_id"],
+            "intention_description": failure_context.get("intention_description")
+            or "(no description)",
+            "plan_status": failure_context.get("plan_status", "unknown"),
+            "failed_step_number": failure_context["failed_step_number"],
+            "total_steps_in_plan": failure_context["total_steps_in_plan"],
+            "failed_step_description": failure_context["failed_step_description"],
+            "original_failed_step_object": serialized["original_failed_step_object"],
+            "is_tool_call": is_tool_call,
+            "tool_name": failure_context["tool_name"] if is_tool_call else "N/A",
+            "tool_params": serialized["tool_params"]
+            if is_tool_call and failure_context["tool_params"]
+            else "N/A",
+            "step_result_output": serialized["step_result_output"],
+            "current_beliefs": serialized["current_beliefs"],
+            "remaining_plan_steps": serialized["remaining_plan_steps"],
+            "user_nl_instruction": user_nl_instruction,
+            "tools_description_for_llm": tools_description_for_llm,
+        }
     )
 
 
@@ -448,6 +628,12 @@ def build_belief_name_resolution_prompt(
 
 
 __all__ = [
+    "DESIRE_SATISFACTION_INSTRUCTIONS",
+    "INITIAL_BELIEF_EXTRACTION_INSTRUCTIONS",
+    "PLANNING_INSTRUCTIONS",
+    "RECONSIDERATION_INSTRUCTIONS",
+    "STEP_ANALYSIS_INSTRUCTIONS",
+    "STEP_BELIEF_EXTRACTION_INSTRUCTIONS",
     "build_descriptive_execution_prompt",
     "build_hitl_interpretation_prompt",
     "build_initial_belief_extraction_prompt",
@@ -456,7 +642,8 @@ __all__ = [
     "build_reconsideration_prompt",
     "build_belief_update_resolution_prompt",
     "build_belief_name_resolution_prompt",
-    "build_step_assessment_prompt",
+    "build_step_analysis_prompt",
     "build_step_belief_extraction_prompt",
     "build_tool_execution_prompt",
+    "serialize_failure_context",
 ]
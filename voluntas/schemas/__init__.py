@@ -38,6 +38,7 @@ from voluntas.schemas.reconsider_schemas import (
     DesireSatisfactionResult,
     PlanReconsiderationAction,
     ReconsiderResult,
+    StepAnalysisResult,
     StepAssessmentResult,
 )
 
@@ -69,6 +70,7 @@ __all__ = [
     "DesireSatisfactionResult",
     "PlanReconsiderationAction",
     "ReconsiderResult",
+    "StepAnalysisResult",
     "StepAssessmentResult",
     # HITL schemas
     "PlanManipulationDirective",
@@ -4,10 +4,10 @@ This module contains data models for representing beliefs, managing belief sets,
 and extracting beliefs from step execution results.
 """
 
-from datetime import datetime
+import time
 from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 BeliefMutation = Literal["created", "updated", "unchanged"]
 
@@ -22,33 +22,56 @@ class Belief(BaseModel):
     certainty: float = 1.0
 
 
+# Built once and reused so (de)serialization skips per-call validator setup.
+_BELIEF_LIST_ADAPTER = TypeAdapter(List[Belief])
+
+
 class BeliefSet:
     """Manages the agent's beliefs."""
 
     def __init__(self):
         self.beliefs: Dict[str, Belief] = {}
+        # Bumped on every mutation so derived views can be reused until then.
+        self.version: int = 0
+        self._changed_at: Dict[str, int] = {}
+        self._render_cache: Dict[tuple[str, str], str] = {}
+
+    def _touch(self, name: str) -> None:
+        self.version += 1
+        self._changed_at[name] = self.version
+        self._render_cache.clear()
 
     def add(self, belief: Belief):
         """Add or update a belief."""
         self.beliefs[belief.name] = belief
+        self._touch(belief.name)
 
     def get(self, name: str) -> Optional[Belief]:
         """Retrieve a belief by name."""
         return self.beliefs.get(name)
 
     def upsert(
-        self, name: str, value: Any, source: str, certainty: float = 1.0
+        self,
+        name: str,
+        value: Any,
+        source: str,
+        certainty: float = 1.0,
+        timestamp: Optional[float] = None,
     ) -> BeliefMutation:
         """Insert or update a belief, returning mutation state.
 
+        Callers applying a batch may pass one shared ``timestamp``; otherwise
+        the current time is used.
+
         Returns:
             "created" when a new belief is added,
             "updated" when an existing belief value changes or certainty increases,
             "unchanged" when the value is the same and certainty does not improve.
         """
         existing = self.beliefs.get(name)
+        if timestamp is None:
+            timestamp = time.time()
         if not existing:
-            timestamp = datetime.now().timestamp()
             self.add(
                 Belief(
                     name=name,
@@ -64,17 +87,17 @@ class BeliefSet:
             if certainty <= existing.certainty:
                 return "unchanged"
 
-            timestamp = datetime.now().timestamp()
             existing.source = source
             existing.timestamp = timestamp
             existing.certainty = certainty
+            self._touch(name)
             return "updated"
 
-        timestamp = datetime.now().timestamp()
         existing.value = value
         existing.source = source
         existing.timestamp = timestamp
         existing.certainty = certainty
+        self._touch(name)
         return "updated"
 
     def update(
@@ -87,6 +110,58 @@ class BeliefSet:
         """Remove a belief."""
         if name in self.beliefs:
             del self.beliefs[name]
+            self._touch(name)
+            del self._changed_at[name]
+
+    def changed_since(self, version: int) -> Dict[str, Belief]:
+        """Return beliefs created or modified after the given version."""
+        if version >= self.version:
+            return {}
+        return {
+            name: self.beliefs[name]
+            for name, changed_at in self._changed_at.items()
+            if changed_at > version
+        }
+
+    def render(self, line_format: str, empty_text: str) -> str:
+        """Render beliefs one per line, reusing the text until the next mutation.
+
+        Args:
+            line_format: `str.format` template receiving name, value, source,
+                and certainty for each belief
+            empty_text: Text returned when there are no beliefs
+        """
+        key = (line_format, empty_text)
+        cached = self._render_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if self.beliefs:
+            text = "\n".join(
+                line_format.format(
+                    name=name,
+                    value=belief.value,
+                    source=belief.source,
+                    certainty=belief.certainty,
+                )
+                for name, belief in self.beliefs.items()
+            )
+        else:
+            text = empty_text
+        self._render_cache[key] = text
+        return text
+
+    def dump_json(self) -> bytes:
+        """Serialize all beliefs to JSON for persistence or transport."""
+        return _BELIEF_LIST_ADAPTER.dump_json(list(self.beliefs.values()))
+
+    @classmethod
+    def load_json(cls, data: str | bytes) -> "BeliefSet":
+        """Build a belief set from JSON produced by `dump_json`."""
+        belief_set = cls()
+        for belief in _BELIEF_LIST_ADAPTER.validate_json(data):
+            belief_set.add(belief)
+        return belief_set
 
 
 class ExtractedBelief(BaseModel):
@@ -5,9 +5,9 @@ and their lifecycle status.
 """
 
 import hashlib
-from typing import Optional, Callable
+from typing import Optional
 from pydantic import BaseModel, Field
-from datetime import datetime
+import time
 from enum import Enum
 
 
@@ -22,7 +22,7 @@ def generate_desire_id(description: str, timestamp: float | None = None) -> str:
         A unique ID in format 'desire_<8-char-hash>'
     """
     if timestamp is None:
-        timestamp = datetime.now().timestamp()
+        timestamp = time.time()
     content = f"{description}:{timestamp}"
     hash_digest = hashlib.sha256(content.encode()).hexdigest()[:8]
     return f"desire_{hash_digest}"
@@ -44,18 +44,9 @@ class Desire(BaseModel):
     description: str
     priority: float = Field(ge=0.0, le=1.0, default=0.5)
     status: DesireStatus = DesireStatus.PENDING
-    created_at: float = Field(default_factory=lambda: datetime.now().timestamp())
+    created_at: float = Field(default_factory=time.time)
     achieved_at: Optional[float] = None
 
-    def update_status(self, new_status: DesireStatus, logger: Callable):
-        self.status = new_status
-        if new_status == DesireStatus.ACHIEVED:
-            self.achieved_at = datetime.now().timestamp()
-        logger(
-            types=["desires"],
-            message=f"Desire '{self.id}' status updated to {new_status}",
-        )
-
 
 __all__ = [
     "Desire",
@@ -7,6 +7,8 @@ directives that structure how the agent should respond to user guidance.
 from typing import Dict, List, Any, Optional, Literal
 from pydantic import BaseModel, Field
 
+from voluntas.schemas.plan_schemas import PlanStep
+
 
 class PlanManipulationDirective(BaseModel):
     """
@@ -37,11 +39,10 @@ class PlanManipulationDirective(BaseModel):
         "e.g., {'tool_params': {'new_param': 'value'}, 'description': 'new step description'}.",
     )
 
-    new_steps_definition: Optional[List[Dict[str, Any]]] = Field(
+    new_steps_definition: Optional[List[PlanStep]] = Field(
         None,
         description="Definitions for new steps if manipulation_type involves adding/replacing steps. "
-        "Each dictionary in the list should conform to the PlanStep schema "
-        "and will be used to create new PlanStep objects.",
+        "Each entry is a PlanStep and is validated when the directive is parsed.",
     )
 
     beliefs_to_update: Optional[Dict[str, Dict[str, Any]]] = Field(
@@ -1,10 +1,10 @@
 """Plan-related schemas for executable BDI strategy."""
 
-from datetime import datetime
+import time
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class PlanStatus(str, Enum):
@@ -44,6 +44,7 @@ class PlanStepHistory(BaseModel):
     success: bool
     timestamp: float
     beliefs_updated: Dict[str, Any]
+    beliefs_version: int = 0
 
 
 class Plan(BaseModel):
@@ -53,6 +54,10 @@ class Plan(BaseModel):
     current_step_index: int = 0
     status: PlanStatus = PlanStatus.ACTIVE
     step_history: List[PlanStepHistory] = Field(default_factory=list)
+    # Rendered history context keyed by (history length, max_history, details).
+    _history_context_cache: Dict[Tuple[int, int, bool], str] = PrivateAttr(
+        default_factory=dict
+    )
 
     def is_complete(self) -> bool:
         """Return True when every Plan Step has been advanced past."""
@@ -87,22 +92,16 @@ class Plan(BaseModel):
         """Replace the current Plan Step with one or more Plan Steps."""
         if self.current_step() is None:
             raise IndexError("No current Plan Step to replace")
-        self.steps = (
-            self.steps[: self.current_step_index]
-            + new_steps
-            + self.steps[self.current_step_index + 1 :]
-        )
+        index = self.current_step_index
+        self.steps[index : index + 1] = new_steps
         self.status = PlanStatus.ACTIVE
 
     def insert_steps_before_current(self, new_steps: List[PlanStep]) -> None:
         """Insert Plan Steps before the current Plan Step without changing commitment."""
         if self.current_step() is None:
             raise IndexError("No current Plan Step before which to insert")
-        self.steps = (
-            self.steps[: self.current_step_index]
-            + new_steps
-            + self.steps[self.current_step_index :]
-        )
+        index = self.current_step_index
+        self.steps[index:index] = new_steps
         self.status = PlanStatus.ACTIVE
 
     def insert_steps_after_current(self, new_steps: List[PlanStep]) -> None:
@@ -110,12 +109,12 @@ class Plan(BaseModel):
         if self.current_step() is None:
             raise IndexError("No current Plan Step after which to insert")
         insert_point = self.current_step_index + 1
-        self.steps = self.steps[:insert_point] + new_steps + self.steps[insert_point:]
+        self.steps[insert_point:insert_point] = new_steps
         self.status = PlanStatus.ACTIVE
 
     def replace_remaining_steps(self, new_steps: List[PlanStep]) -> None:
         """Replace the current and future Plan Steps, preserving completed steps."""
-        self.steps = self.steps[: self.current_step_index] + new_steps
+        self.steps[self.current_step_index :] = new_steps
         self.status = PlanStatus.ACTIVE
 
     def repair(self, repaired_steps: List[PlanStep]) -> None:
@@ -161,16 +160,19 @@ class Plan(BaseModel):
         result: str,
         success: bool,
         beliefs_updated: Dict[str, Any],
+        beliefs_version: int = 0,
     ) -> None:
         """Record a Plan Step execution in Plan Step History."""
+        self._history_context_cache.clear()
         self.step_history.append(
             PlanStepHistory(
                 step_description=step.description,
                 step_number=self.current_step_index,
                 result=result,
                 success=success,
-                timestamp=datetime.now().timestamp(),
+                timestamp=time.time(),
                 beliefs_updated=beliefs_updated,
+                beliefs_version=beliefs_version,
             )
         )
 
@@ -179,11 +181,12 @@ class Plan(BaseModel):
         step: PlanStep,
         result: str,
         beliefs_updated: Dict[str, Any],
+        beliefs_version: int = 0,
     ) -> bool:
         """Record a successful current step and advance atomically."""
         if step is not self.current_step():
             raise ValueError("Outcome does not belong to the current Plan Step")
-        self.add_to_history(step, result, True, beliefs_updated)
+        self.add_to_history(step, result, True, beliefs_updated, beliefs_version)
         return self.advance_current_step()
 
     def record_failure(
@@ -191,11 +194,12 @@ class Plan(BaseModel):
         step: PlanStep,
         result: str,
         beliefs_updated: Dict[str, Any],
+        beliefs_version: int = 0,
     ) -> None:
         """Record a failed current step and transition the Plan to failed."""
         if step is not self.current_step():
             raise ValueError("Outcome does not belong to the current Plan Step")
-        self.add_to_history(step, result, False, beliefs_updated)
+        self.add_to_history(step, result, False, beliefs_updated, beliefs_version)
         self.fail()
 
 
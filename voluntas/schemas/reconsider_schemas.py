@@ -7,6 +7,7 @@ from typing import Literal
 
 from pydantic import BaseModel, Field
 
+from voluntas.schemas.belief_schemas import ExtractedBelief
 from voluntas.schemas.plan_schemas import PlanStep
 
 PlanReconsiderationAction = Literal[
@@ -29,12 +30,28 @@ class ReconsiderResult(BaseModel):
 
 
 class StepAssessmentResult(BaseModel):
-    """Result of step success assessment."""
+    """Result of step success assessment.
+
+    Deprecated: step outcomes are analyzed with `StepAnalysisResult`, which
+    also carries the extracted beliefs. Kept for backwards compatibility.
+    """
 
     success: bool
     reason: str | None = None
 
 
+class StepAnalysisResult(BaseModel):
+    """Step success assessment and belief extraction from a single call."""
+
+    success: bool
+    reason: str | None = None
+    beliefs: list[ExtractedBelief] = Field(
+        default_factory=list,
+        description="List of beliefs extracted from the step result",
+    )
+    explanation: str | None = None
+
+
 class DesireSatisfactionResult(BaseModel):
     """Result of desire satisfaction assessment after an intention completes."""
 
@@ -46,5 +63,6 @@ __all__ = [
     "DesireSatisfactionResult",
     "PlanReconsiderationAction",
     "ReconsiderResult",
+    "StepAnalysisResult",
     "StepAssessmentResult",
 ]
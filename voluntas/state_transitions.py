@@ -1,10 +1,14 @@
 """Shared desire lifecycle transitions for intentions and desires."""
 
+import time
 from typing import TYPE_CHECKING, Literal
 
 from voluntas._utils import bcolors
 from voluntas.logging import format_beliefs_for_context, log_states
-from voluntas.prompts import build_desire_satisfaction_prompt
+from voluntas.prompts import (
+    DESIRE_SATISFACTION_INSTRUCTIONS,
+    build_desire_satisfaction_prompt,
+)
 from voluntas.schemas import DesireSatisfactionResult, DesireStatus
 
 if TYPE_CHECKING:
@@ -14,6 +18,30 @@ if TYPE_CHECKING:
 
 RemovalResult = Literal["current", "missing"]
 TERMINAL_DESIRE_STATUSES = {DesireStatus.ACHIEVED, DesireStatus.FAILED}
+ACTIVE_DESIRE_STATUSES = {DesireStatus.PENDING, DesireStatus.ACTIVE}
+
+
+def _find_desire(agent: "BDI", desire_id: str) -> "Desire | None":
+    """Find a desire by ID through ``agent._desires_by_id`` (ID -> list position).
+
+    Callers mutate ``agent.desires`` directly, so every hit is checked against
+    the list slot it points at; a stale or missing entry rebuilds the index.
+    """
+    desires = agent.desires
+    position = agent._desires_by_id.get(desire_id)
+    if (
+        position is not None
+        and position < len(desires)
+        and desires[position].id == desire_id
+    ):
+        return desires[position]
+
+    index: dict[str, int] = {}
+    for position, desire in enumerate(desires):
+        index.setdefault(desire.id, position)
+    agent._desires_by_id = index
+    position = index.get(desire_id)
+    return desires[position] if position is not None else None
 
 
 def update_desire_status(
@@ -24,20 +52,25 @@ def update_desire_status(
     force: bool = False,
 ) -> bool:
     """Update a desire status by ID; returns True when the desire is found."""
-    for desire in agent.desires:
-        if desire.id != desire_id:
-            continue
-
-        if force or desire.status != status:
-            desire.update_status(status, lambda **kwargs: log_states(agent, **kwargs))
-        return True
-
-    return False
+    desire = _find_desire(agent, desire_id)
+    if desire is None:
+        return False
+
+    if force or desire.status != status:
+        desire.status = status
+        if status is DesireStatus.ACHIEVED:
+            desire.achieved_at = time.time()
+        log_states(
+            agent,
+            types=["desires"],
+            message=f"Desire '{desire.id}' status updated to {status}",
+        )
+    return True
 
 
 def remove_intention(agent: "BDI", intention: "Intention") -> RemovalResult:
-    """Remove the active intention when it matches."""
-    if agent.active_intention == intention:
+    """Remove the active intention when it is the given object."""
+    if agent.active_intention is intention:
         agent.active_intention = None
         return "current"
     return "missing"
@@ -50,11 +83,9 @@ def all_desires_terminal(agent: "BDI") -> bool:
     )
 
 
-def _find_desire(agent: "BDI", desire_id: str) -> "Desire | None":
-    for desire in agent.desires:
-        if desire.id == desire_id:
-            return desire
-    return None
+def has_active_desires(agent: "BDI") -> bool:
+    """Return True when at least one desire is pending or active."""
+    return any(desire.status in ACTIVE_DESIRE_STATUSES for desire in agent.desires)
 
 
 def _remove_active_intention_for_desire(agent: "BDI", desire_id: str) -> int:
@@ -98,6 +129,7 @@ async def assess_desire_satisfaction(
         assessment_result = await agent.run(
             prompt,
             output_type=DesireSatisfactionResult,
+            instructions=DESIRE_SATISFACTION_INSTRUCTIONS,
         )
     except Exception as error:
         reason = f"Desire satisfaction assessment failed: {error}"
@@ -202,6 +234,7 @@ __all__ = [
     "complete_intention_and_update_desire",
     "fail_desire_for_intention",
     "finalize_current_intention",
+    "has_active_desires",
     "replan_desire_for_intention",
     "remove_intention",
     "update_desire_status",